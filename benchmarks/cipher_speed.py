@@ -0,0 +1,107 @@
+"""
+Find the fastest SSH cipher on this host.
+
+Connects to an in-process SFTP server on 127.0.0.1 once per cipher that
+paramiko supports, downloads and uploads the same file, and reports the
+handshake time and throughput of each. The fastest cipher is printed as a
+TransferTuning setting.
+
+Usage:
+    python benchmarks/cipher_speed.py [--size-mb 32] [--repeat 3]
+
+Both ends run in this process, so each row pays for encryption and
+decryption: the ranking carries over, the absolute numbers do not. Like
+the CLI, importing slate_sftp needs config.py to be importable, so put the
+directory that holds it on PYTHONPATH.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import paramiko
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _local_server import LocalSFTPServer  # noqa: E402
+from slate_sftp import SlateSFTP, TransferTuning  # noqa: E402
+
+MiB = 1024 * 1024
+
+
+def measure(server, cipher, local_source, local_copy, repeat):
+    """Return (handshake seconds, download seconds, upload seconds), best of repeat."""
+    best = None
+    for _ in range(repeat):
+        sftp = SlateSFTP(
+            hostname="127.0.0.1",
+            port=server.port,
+            username="bench",
+            private_key_path=server.client_key_path,
+            tuning=TransferTuning(ciphers=(cipher,)),
+        )
+        start = time.perf_counter()
+        if not sftp.connect():
+            raise RuntimeError(f"Could not connect with {cipher}")
+        try:
+            negotiated = sftp.transport.local_cipher
+            if negotiated != cipher:
+                raise RuntimeError(f"Negotiated {negotiated} instead of {cipher}")
+            handshake = time.perf_counter() - start
+            start = time.perf_counter()
+            if not sftp.download_file("/download.bin", local_copy):
+                raise RuntimeError("Download failed")
+            download = time.perf_counter() - start
+            start = time.perf_counter()
+            if not sftp.upload_file(local_source, "/upload.bin"):
+                raise RuntimeError("Upload failed")
+            upload = time.perf_counter() - start
+        finally:
+            sftp.close()
+        run = (handshake, download, upload)
+        best = run if best is None else tuple(map(min, best, run))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the fastest SSH cipher on this host")
+    parser.add_argument("--size-mb", type=int, default=32, help="Size of the test file in MiB")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per cipher (best is kept)")
+    args = parser.parse_args()
+
+    ciphers = paramiko.Transport._preferred_ciphers
+    with tempfile.TemporaryDirectory() as remote_root, tempfile.TemporaryDirectory() as local_dir:
+        local_source = os.path.join(local_dir, "source.bin")
+        payload = os.urandom(args.size_mb * MiB)
+        for path in (local_source, os.path.join(remote_root, "download.bin")):
+            with open(path, "wb") as f:
+                f.write(payload)
+
+        print(f"Transferring a {args.size_mb} MiB file per cipher, best of {args.repeat}\n")
+        print(f"{'Cipher':<32} {'Handshake (ms)':>15} {'Download (MiB/s)':>17} {'Upload (MiB/s)':>15}")
+        print("-" * 82)
+
+        results = []
+        with LocalSFTPServer(remote_root) as server:
+            for cipher in ciphers:
+                try:
+                    handshake, download, upload = measure(
+                        server, cipher, local_source, os.path.join(local_dir, "download.bin"), args.repeat
+                    )
+                except Exception as e:
+                    print(f"{cipher:<32} skipped: {e}")
+                    continue
+                results.append((args.size_mb * 2 / (download + upload), cipher))
+                print(f"{cipher:<32} {handshake * 1000:>15,.1f} "
+                      f"{args.size_mb / download:>17,.1f} {args.size_mb / upload:>15,.1f}")
+
+    if results:
+        _, fastest = max(results)
+        print(f"\nFastest: {fastest}")
+        print(f"Use it with: TransferTuning(ciphers=({fastest!r},))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Memory benchmark for remote directory listings.
+
+Compares the memory held by three representations of the same synthetic
+listing:
+
+1. list-of-str plus stat: the file names from listdir() plus the
+   SFTPAttributes returned by one stat() per name
+2. A list of RemoteEntry objects
+3. A columnar EntryListing
+
+It also times a "size > X and modified since Y" filter on each.
+
+What the filter numbers measure: for the two lists, a comprehension that
+collects references to the matching objects, which already hold boxed
+Python ints; for EntryListing, where(), which tests every row in one pass
+and builds a new compact listing of the matches, and mask() alone. Reading
+a value from a typed array creates a Python int, so the columnar filter
+costs a few times the comprehension over list[RemoteEntry] (on the order
+of 4x at 1,000,000 entries); what it buys is half the memory of that list,
+a third of list-of-str plus stat, and no per-entry objects at any point.
+
+Usage:
+    python benchmarks/listing_memory.py [--entries 1000000]
+
+Like the CLI, importing slate_sftp needs config.py to be importable, so put
+the directory that holds it on PYTHONPATH.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import paramiko
+
+from slate_sftp.entries import EntryListing, RemoteEntry
+
+
+def make_attributes(count):
+    """Build the SFTPAttributes a server would return for count files."""
+    base_mtime = 1700000000
+    for i in range(count):
+        attr = paramiko.SFTPAttributes()
+        attr.filename = f"2024ModelProspApps_{i:08d}.csv"
+        attr.st_size = (i * 7919) % 50000000
+        attr.st_mtime = base_mtime + i % 86400
+        attr.st_atime = attr.st_mtime
+        attr.st_mode = 0o100644
+        attr.st_uid = 1000
+        attr.st_gid = 1000
+        yield attr
+
+
+def measure(build):
+    """Return (result, bytes held, seconds) for building a representation."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def build_names_and_stats(count):
+    names = []
+    stats = []
+    for attr in make_attributes(count):
+        names.append(attr.filename)
+        stats.append(attr)
+    return names, stats
+
+
+def build_entries(count):
+    return [RemoteEntry.from_attributes(attr) for attr in make_attributes(count)]
+
+
+def build_columnar(count):
+    listing = EntryListing()
+    for attr in make_attributes(count):
+        listing.append(attr.filename, attr.st_size, attr.st_mtime, attr.st_mode)
+    return listing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare listing memory footprints")
+    parser.add_argument("--entries", type=int, default=1000000, help="Number of synthetic entries")
+    args = parser.parse_args()
+
+    min_size = 1000000
+    since = 1700000000 + 43200
+
+    print(f"Listing of {args.entries:,} entries\n")
+    print(f"{'Representation':<28} {'Memory (MB)':>12} {'Bytes/entry':>12} {'Filter (ms)':>12} {'Matches':>10}")
+    print("-" * 78)
+
+    (names, stats), held, _ = measure(lambda: build_names_and_stats(args.entries))
+    start = time.perf_counter()
+    matches = [n for n, st in zip(names, stats) if st.st_size > min_size and st.st_mtime >= since]
+    filter_ms = (time.perf_counter() - start) * 1000
+    print(f"{'list[str] + stat()':<28} {held / 1e6:>12,.1f} {held / args.entries:>12,.0f} {filter_ms:>12,.1f} {len(matches):>10,}")
+    del names, stats, matches
+
+    entries, held, _ = measure(lambda: build_entries(args.entries))
+    start = time.perf_counter()
+    matches = [e for e in entries if e.size > min_size and e.mtime >= since]
+    filter_ms = (time.perf_counter() - start) * 1000
+    print(f"{'list[RemoteEntry]':<28} {held / 1e6:>12,.1f} {held / args.entries:>12,.0f} {filter_ms:>12,.1f} {len(matches):>10,}")
+    del entries, matches
+
+    listing, held, _ = measure(lambda: build_columnar(args.entries))
+    start = time.perf_counter()
+    matches = listing.where(min_size=min_size, since=since)
+    filter_ms = (time.perf_counter() - start) * 1000
+    print(f"{'EntryListing (columnar)':<28} {held / 1e6:>12,.1f} {held / args.entries:>12,.0f} {filter_ms:>12,.1f} {len(matches):>10,}")
+    start = time.perf_counter()
+    mask = listing.mask(min_size=min_size, since=since)
+    filter_ms = (time.perf_counter() - start) * 1000
+    print(f"{'  mask() only':<28} {'':>12} {'':>12} {filter_ms:>12,.1f} {sum(mask):>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark the TransferTuning knobs against a local SFTP server.
+
+Starts an in-process SFTP server on 127.0.0.1 and times downloading and
+uploading the same file under a series of tuning profiles. Each profile
+changes one knob from the defaults, so each row shows that knob's effect
+on its own.
+
+Usage:
+    python benchmarks/transport_tuning.py [--size-mb 64] [--repeat 3]
+
+Over loopback the network is effectively free, so this mostly shows each
+knob's CPU and request-count cost. Window size and prefetch depth matter
+most on high-latency links. Like the CLI, importing slate_sftp needs
+config.py to be importable, so put the directory that holds it on
+PYTHONPATH.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _local_server import LocalSFTPServer  # noqa: E402
+from slate_sftp import SlateSFTP, TransferTuning  # noqa: E402
+
+MiB = 1024 * 1024
+
+PROFILES = [
+    ("defaults", {}),
+    ("window 8 MiB", {"window_size": 8 * MiB}),
+    ("window 64 MiB", {"window_size": 64 * MiB}),
+    ("max packet 16 KiB", {"max_packet_size": 16 * 1024}),
+    ("prefetch off", {"prefetch": False}),
+    ("prefetch depth 8", {"max_concurrent_prefetch_requests": 8}),
+    ("prefetch depth 64", {"max_concurrent_prefetch_requests": 64}),
+    ("chunks 16 KiB", {"read_chunk_size": 16 * 1024, "write_chunk_size": 16 * 1024}),
+    ("chunks 64 KiB", {"read_chunk_size": 64 * 1024, "write_chunk_size": 64 * 1024}),
+    ("chunks 128 KiB", {"read_chunk_size": 128 * 1024, "write_chunk_size": 128 * 1024}),
+]
+
+
+def best_time(operation, repeat):
+    """Run operation repeat times and return the fastest wall-clock time."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if not operation():
+            raise RuntimeError("Transfer failed")
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SFTP tuning knobs against a local server")
+    parser.add_argument("--size-mb", type=int, default=64, help="Size of the test file in MiB")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as remote_root, tempfile.TemporaryDirectory() as local_dir:
+        local_source = os.path.join(local_dir, "source.bin")
+        with open(local_source, "wb") as f:
+            for _ in range(args.size_mb):
+                f.write(os.urandom(MiB))
+        with open(os.path.join(remote_root, "download.bin"), "wb") as f:
+            with open(local_source, "rb") as source:
+                f.write(source.read())
+
+        size = args.size_mb * MiB
+        print(f"Transferring a {args.size_mb} MiB file, best of {args.repeat}\n")
+        print(f"{'Profile':<22} {'Download (MiB/s)':>18} {'Upload (MiB/s)':>16}")
+        print("-" * 58)
+
+        with LocalSFTPServer(remote_root) as server:
+            for name, knobs in PROFILES:
+                with SlateSFTP(
+                    hostname="127.0.0.1",
+                    port=server.port,
+                    username="bench",
+                    private_key_path=server.client_key_path,
+                    tuning=TransferTuning(**knobs),
+                ) as sftp:
+                    local_copy = os.path.join(local_dir, "download.bin")
+                    download = best_time(lambda: sftp.download_file("/download.bin", local_copy), args.repeat)
+                    upload = best_time(lambda: sftp.upload_file(local_source, "/upload.bin"), args.repeat)
+                print(f"{name:<22} {size / MiB / download:>18,.1f} {size / MiB / upload:>16,.1f}")
+
+
+if __name__ == "__main__":
+    main()
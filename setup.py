@@ -20,7 +20,7 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=[
-        "paramiko>=2.7.0",
+        "paramiko>=3.3.0",
     ],
     entry_points={
         "console_scripts": [
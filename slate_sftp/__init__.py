@@ -3,6 +3,14 @@ slate_sftp - A Python package for interacting with Slate SFTP servers
 """
 
 from .client import SlateSFTP
+from .pool import SlateSFTPPool
+from .aio import AsyncSlateSFTP
+from .cache import MetadataCache
+from .entries import EntryListing, RemoteEntry
+from .transfer import TransferReport, TransferResult
+from .capabilities import ServerCapabilities
+from .tuning import TransferTuning
+from .manifest import ManifestRecord, TransferManifest
 from .file_manager import main as file_manager_main
 
 __version__ = "0.1.0-beta.1"
\ No newline at end of file
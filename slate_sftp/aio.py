@@ -0,0 +1,273 @@
+"""
+An asyncio front end for SlateSFTP.
+
+paramiko is a blocking library, so AsyncSlateSFTP does not start a thread
+per call. It opens a fixed set of SFTP channels on one connection, gives
+each channel a single thread of its own, and queues coroutines for the
+next free channel. Any number of coroutines can then share a few channels
+and a few threads.
+
+AsyncSlateSFTP needs Python 3.7 or later (asyncio.get_running_loop).
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Tuple
+
+from .entries import RemoteEntry
+from .tree import scan_local_tree
+
+
+class AsyncSlateSFTP:
+    """
+    Awaitable SlateSFTP operations spread over a fixed set of channels.
+
+    Every operation waits for a free channel and runs on that channel's
+    thread, so at most `channels` operations use the network at once and
+    the rest wait without holding a thread. max_concurrency lowers that
+    limit further.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int = 22,
+        username: str = None,
+        private_key_path: str = None,
+        channels: int = 4,
+        max_concurrency: Optional[int] = None,
+        **client_options
+    ):
+        """
+        Initialize the client. Nothing is opened until connect().
+
+        Args:
+            hostname: The SFTP server hostname
+            port: The SFTP server port (default: 22)
+            username: Your SFTP username
+            private_key_path: Path to your private key file
+            channels: Number of SFTP channels (and threads) to open (default: 4)
+            max_concurrency: Maximum operations running at once
+                (default: None, one per channel)
+            **client_options: Passed to SlateSFTP, e.g. tuning or cache_ttl
+        """
+        from .client import SlateSFTP
+
+        if channels < 1:
+            raise ValueError("channels must be at least 1")
+        self.client = SlateSFTP(hostname, port, username, private_key_path, **client_options)
+        self.channels = channels
+        self.max_concurrency = max_concurrency or channels
+        self._workers = []
+        self._executors = []
+        self._idle = None
+        self._limit = None
+
+    async def connect(self) -> bool:
+        """
+        Connect and open the channels.
+
+        Returns:
+            bool: True if connection was successful, False otherwise
+        """
+        loop = asyncio.get_running_loop()
+        # The first channel's thread also makes the connection
+        first = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slate-sftp")
+        self._executors = [first]
+        if not await loop.run_in_executor(first, self.client.connect):
+            await self.close()
+            return False
+
+        self._workers = [self.client]
+        try:
+            for _ in range(self.channels - 1):
+                self._workers.append(await loop.run_in_executor(first, self.client._open_worker))
+                self._executors.append(ThreadPoolExecutor(max_workers=1, thread_name_prefix="slate-sftp"))
+        except Exception as e:
+            print(f"Connection error: {str(e)}")
+            await self.close()
+            return False
+
+        # Created here so they belong to the running event loop
+        self._idle = asyncio.Queue()
+        for channel in zip(self._workers, self._executors):
+            self._idle.put_nowait(channel)
+        self._limit = asyncio.Semaphore(self.max_concurrency)
+        return True
+
+    async def close(self):
+        """Close the channels, the connection and their threads."""
+        loop = asyncio.get_running_loop()
+        workers, self._workers = self._workers, []
+        if self._executors:
+            for worker in workers[1:]:
+                await loop.run_in_executor(self._executors[0], worker.close)
+            await loop.run_in_executor(self._executors[0], self.client.close)
+        for executor in self._executors:
+            executor.shutdown(wait=False)
+        self._executors = []
+        self._idle = None
+
+    async def __aenter__(self):
+        """Support for the async context manager protocol."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Support for the async context manager protocol."""
+        await self.close()
+
+    async def list_entries(self, remote_path: str = '.') -> List[RemoteEntry]:
+        """Awaitable SlateSFTP.list_entries."""
+        return await self._call("list_entries", remote_path)
+
+    async def list_directories(self, remote_path: str = '.') -> List[str]:
+        """Awaitable SlateSFTP.list_directories."""
+        return await self._call("list_directories", remote_path)
+
+    async def list_files(self, remote_path: str = '.') -> List[str]:
+        """Awaitable SlateSFTP.list_files."""
+        return await self._call("list_files", remote_path)
+
+    async def list_all(self, remote_path: str = '.') -> Tuple[List[str], List[str]]:
+        """Awaitable SlateSFTP.list_all."""
+        return await self._call("list_all", remote_path)
+
+    async def create_directory(self, remote_path: str, mode: int = 0o755) -> bool:
+        """Awaitable SlateSFTP.create_directory."""
+        return await self._call("create_directory", remote_path, mode)
+
+    async def download_file(self, remote_path: str, local_path: str, resume: bool = False) -> bool:
+        """Awaitable SlateSFTP.download_file."""
+        return await self._call("download_file", remote_path, local_path, resume=resume)
+
+    async def upload_file(self, local_path: str, remote_path: str, resume: bool = False) -> bool:
+        """Awaitable SlateSFTP.upload_file."""
+        return await self._call("upload_file", local_path, remote_path, resume=resume)
+
+    async def download_directory(
+        self, remote_dir: str, local_dir: str, recursive: bool = True, resume: bool = False
+    ) -> bool:
+        """
+        Download an entire directory, interleaving listings and file downloads.
+
+        Each file is downloaded by its own task as soon as its directory has
+        been listed; the tasks share the channels with the listings.
+
+        Args:
+            remote_dir: The path of the directory on the remote server
+            local_dir: The path where the directory should be saved locally
+            recursive: Whether to download subdirectories (default: True)
+            resume: Whether to resume interrupted downloads (default: False)
+
+        Returns:
+            bool: True if every file was downloaded successfully, False otherwise
+        """
+        transfers = _TaskGroup(self.max_concurrency * 4)
+        try:
+            directories = [(remote_dir, local_dir)]
+            while directories:
+                remote_path, local_path = directories.pop()
+                os.makedirs(local_path, exist_ok=True)
+                for entry in await self.list_entries(remote_path):
+                    remote_child = os.path.join(remote_path, entry.name)
+                    local_child = os.path.join(local_path, entry.name)
+                    if not entry.is_dir:
+                        await transfers.start(self.download_file(remote_child, local_child, resume))
+                    elif recursive:
+                        directories.append((remote_child, local_child))
+        except Exception as e:
+            print(f"Failed to download directory {remote_dir}: {str(e)}")
+            await transfers.wait()
+            return False
+        return await transfers.wait()
+
+    async def upload_directory(
+        self, local_dir: str, remote_dir: str, recursive: bool = True, resume: bool = False
+    ) -> bool:
+        """
+        Upload an entire directory, one task per file.
+
+        The remote directories are created parents-first before any file
+        is transferred, as in SlateSFTP.upload_directory.
+
+        Args:
+            local_dir: The path of the directory on the local system
+            remote_dir: The path where the directory should be saved on the remote server
+            recursive: Whether to upload subdirectories (default: True)
+            resume: Whether to continue interrupted uploads (default: False)
+
+        Returns:
+            bool: True if every file was uploaded successfully, False otherwise
+        """
+        transfers = _TaskGroup(self.max_concurrency * 4)
+        try:
+            if not os.path.exists(local_dir):
+                raise FileNotFoundError(f"Local directory not found: {local_dir}")
+
+            loop = asyncio.get_running_loop()
+            tree = await loop.run_in_executor(None, list, scan_local_tree(local_dir, recursive))
+            remote_dirs = [os.path.join(remote_dir, relative) if relative else remote_dir for relative, _, _ in tree]
+            await self._call("prepare_directories", remote_dirs)
+
+            for (relative_dir, _, filenames), remote_path in zip(tree, remote_dirs):
+                for filename in filenames:
+                    await transfers.start(self._call(
+                        "_upload_prepared",
+                        os.path.join(local_dir, relative_dir, filename),
+                        os.path.join(remote_path, filename),
+                        resume=resume,
+                    ))
+        except Exception as e:
+            print(f"Failed to upload directory {local_dir}: {str(e)}")
+            await transfers.wait()
+            return False
+        return await transfers.wait()
+
+    async def _call(self, method: str, *args, **kwargs):
+        """Run a SlateSFTP method on the next free channel's thread."""
+        if self._idle is None:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+        async with self._limit:
+            worker, executor = await self._idle.get()
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    executor, partial(getattr(worker, method), *args, **kwargs)
+                )
+            finally:
+                self._idle.put_nowait((worker, executor))
+
+
+class _TaskGroup:
+    """Runs coroutines returning bool as tasks, at most limit of them unfinished at a time."""
+
+    def __init__(self, limit: int):
+        self._slots = asyncio.Semaphore(limit)
+        self._tasks = set()
+        self.succeeded = True
+
+    async def start(self, coroutine):
+        """Start a task once fewer than limit are running."""
+        await self._slots.acquire()
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._finished)
+
+    async def wait(self) -> bool:
+        """Wait for every task; True if all of them returned True."""
+        if self._tasks:
+            await asyncio.wait(set(self._tasks))
+        return self.succeeded
+
+    def _finished(self, task):
+        self._tasks.discard(task)
+        self._slots.release()
+        if task.cancelled():
+            self.succeeded = False
+        elif task.exception() is not None:
+            print(f"Transfer failed: {str(task.exception())}")
+            self.succeeded = False
+        elif not task.result():
+            self.succeeded = False
@@ -0,0 +1,147 @@
+"""
+In-memory metadata cache for remote stat results and directory listings.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from .tree import paths_under
+
+
+class MetadataCache:
+    """
+    A thread-safe TTL + LRU cache of remote stat results and listings.
+
+    Entries expire ttl seconds after they were stored, and the least
+    recently used entry is evicted once max_entries is reached. Writers
+    call invalidate() for every path they change so the next read goes
+    back to the server.
+    """
+
+    _STAT = "stat"
+    _LISTING = "listing"
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (default: 30)
+            max_entries: Maximum number of cached entries (default: 1024)
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_stat(self, remote_path: str):
+        """Return the cached SFTPAttributes for remote_path, or None."""
+        return self._get((self._STAT, _normalize(remote_path)))
+
+    def put_stat(self, remote_path: str, attributes):
+        """Cache the SFTPAttributes of remote_path."""
+        self._put((self._STAT, _normalize(remote_path)), attributes)
+
+    def get_listing(self, remote_path: str) -> Optional[List[Any]]:
+        """Return a copy of the cached listing of remote_path, or None."""
+        entries = self._get((self._LISTING, _normalize(remote_path)))
+        return list(entries) if entries is not None else None
+
+    def put_listing(self, remote_path: str, entries: List[Any]):
+        """Cache the listing (list of RemoteEntry) of remote_path."""
+        self._put((self._LISTING, _normalize(remote_path)), list(entries))
+
+    def invalidate(self, remote_path: str):
+        """
+        Forget everything a write to remote_path may have changed.
+
+        Drops the stat and listing of the path itself and the listing of
+        its parent directory.
+
+        Args:
+            remote_path: The remote path that was created, changed or removed
+        """
+        path = _normalize(remote_path)
+        parent = os.path.dirname(path) or "."
+        with self._lock:
+            self._entries.pop((self._STAT, path), None)
+            self._entries.pop((self._LISTING, path), None)
+            self._entries.pop((self._LISTING, parent), None)
+
+    def invalidate_trees(self, remote_paths: Iterable[str]):
+        """
+        Forget everything cached at or below remote paths that moved.
+
+        Like invalidate() for each path, and also drops every stat and
+        listing below it, e.g. after directories are renamed. Takes one
+        pass over the cache however many paths are given.
+
+        Args:
+            remote_paths: The remote paths whose whole subtrees changed
+        """
+        roots = {_normalize(remote_path) for remote_path in remote_paths}
+        parents = {os.path.dirname(root) or "." for root in roots}
+        with self._lock:
+            below = set(paths_under({path for _, path in self._entries}, roots))
+            for key in list(self._entries):
+                kind, path = key
+                if path in below or (kind == self._LISTING and path in parents):
+                    del self._entries[key]
+
+    def clear(self):
+        """Drop all cached entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache effectiveness.
+
+        Returns:
+            Dict with hits, misses, evictions and the current number of entries
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+    def _get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None or item[0] <= now:
+                if item is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def _put(self, key, value):
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+def _normalize(remote_path: str) -> str:
+    """Normalize a remote path so equivalent spellings share a cache entry."""
+    path = os.path.normpath(remote_path)
+    return path if path != "" else "."
@@ -0,0 +1,177 @@
+"""
+SFTP server capability probing.
+
+An SFTP server lists the protocol extensions it supports in its VERSION
+reply. paramiko reads that reply but discards the list, so ProbingSFTPClient
+keeps it, and ServerCapabilities records which of the OpenSSH extensions
+this package cares about are available, plus the server's limits.
+"""
+
+import struct
+from typing import Dict, Optional
+
+import paramiko
+from paramiko.message import Message
+from paramiko.sftp import _VERSION, CMD_EXTENDED, CMD_EXTENDED_REPLY, CMD_INIT, CMD_VERSION, SFTPError
+
+LIMITS = "limits@openssh.com"
+POSIX_RENAME = "posix-rename@openssh.com"
+STATVFS = "statvfs@openssh.com"
+FSYNC = "fsync@openssh.com"
+
+# Bytes per request when neither the tuning profile nor the server sets a size
+DEFAULT_CHUNK_SIZE = 32768
+# Largest request size chosen automatically from a server's advertised limits
+MAX_AUTO_CHUNK_SIZE = 256 * 1024
+
+
+class ProbingSFTPClient(paramiko.SFTPClient):
+    """
+    An SFTPClient that keeps the extensions the server announced at startup.
+
+    Attributes:
+        server_version: The SFTP protocol version the server replied with
+        server_extensions: Dict of extension name to the data the server sent with it
+    """
+
+    def _send_version(self):
+        # Same exchange as BaseSFTP._send_version, keeping the extension pairs
+        msg = Message()
+        msg.add_int(_VERSION)
+        self._send_packet(CMD_INIT, msg)
+        t, data = self._read_packet()
+        if t != CMD_VERSION:
+            raise SFTPError("Incompatible sftp protocol")
+        self.server_version = struct.unpack(">I", data[:4])[0]
+        self.server_extensions = {}
+        reply = Message(data[4:])
+        while reply.get_remainder():
+            name = reply.get_text()
+            self.server_extensions[name] = reply.get_binary()
+        return self.server_version
+
+
+class ServerCapabilities:
+    """
+    What an SFTP server supports, as probed right after connecting.
+
+    The limits are 0 when the server did not report them (or has none).
+
+    Attributes:
+        version: The SFTP protocol version of the server
+        extensions: Dict of extension name to the data the server sent with it
+        max_packet_length: Largest SFTP packet the server accepts, in bytes
+        max_read_length: Largest read the server answers in full, in bytes
+        max_write_length: Largest write the server accepts, in bytes
+        max_open_handles: Maximum handles open at once
+    """
+
+    __slots__ = (
+        "version",
+        "extensions",
+        "max_packet_length",
+        "max_read_length",
+        "max_write_length",
+        "max_open_handles",
+    )
+
+    def __init__(self, version: int = 3, extensions: Optional[Dict[str, bytes]] = None):
+        self.version = version
+        self.extensions = dict(extensions or {})
+        self.max_packet_length = 0
+        self.max_read_length = 0
+        self.max_write_length = 0
+        self.max_open_handles = 0
+
+    @classmethod
+    def probe(cls, sftp) -> "ServerCapabilities":
+        """
+        Collect the capabilities of the server behind an SFTP channel.
+
+        The extension list comes from the VERSION reply (only a
+        ProbingSFTPClient keeps it). If the server supports
+        limits@openssh.com, its limits are requested as well.
+
+        Args:
+            sftp: The SFTPClient (channel) to probe
+
+        Returns:
+            ServerCapabilities
+        """
+        capabilities = cls(
+            getattr(sftp, "server_version", 3), getattr(sftp, "server_extensions", None)
+        )
+        if capabilities.limits:
+            try:
+                t, msg = sftp._request(CMD_EXTENDED, LIMITS)
+            except (IOError, EOFError):
+                # Advertised but refused: behave as if there were no limits
+                return capabilities
+            if t == CMD_EXTENDED_REPLY:
+                capabilities.max_packet_length = msg.get_int64()
+                capabilities.max_read_length = msg.get_int64()
+                capabilities.max_write_length = msg.get_int64()
+                capabilities.max_open_handles = msg.get_int64()
+        return capabilities
+
+    def supports(self, extension: str) -> bool:
+        """True if the server announced the named extension."""
+        return extension in self.extensions
+
+    @property
+    def limits(self) -> bool:
+        """True if the server reports its limits (limits@openssh.com)."""
+        return LIMITS in self.extensions
+
+    @property
+    def posix_rename(self) -> bool:
+        """True if the server can rename over an existing file (posix-rename@openssh.com)."""
+        return POSIX_RENAME in self.extensions
+
+    @property
+    def statvfs(self) -> bool:
+        """True if the server reports file system usage (statvfs@openssh.com)."""
+        return STATVFS in self.extensions
+
+    @property
+    def fsync(self) -> bool:
+        """True if the server can flush an open file to disk (fsync@openssh.com)."""
+        return FSYNC in self.extensions
+
+    def read_chunk_size(self, requested: Optional[int] = None) -> int:
+        """
+        Pick the bytes per read request.
+
+        Args:
+            requested: The size asked for, or None to size it from the server's limits
+
+        Returns:
+            int: The requested size capped at the server's max read length;
+            without a request, the server's max read length (at most 256 KiB)
+            or 32 KiB if it reported none
+        """
+        return _chunk_size(requested, self.max_read_length)
+
+    def write_chunk_size(self, requested: Optional[int] = None) -> int:
+        """
+        Pick the bytes per write request.
+
+        Args:
+            requested: The size asked for, or None to size it from the server's limits
+
+        Returns:
+            int: As read_chunk_size, using the server's max write length
+        """
+        return _chunk_size(requested, self.max_write_length)
+
+    def __repr__(self):
+        return "ServerCapabilities(version={}, extensions={}, max_read_length={}, max_write_length={})".format(
+            self.version, sorted(self.extensions), self.max_read_length, self.max_write_length
+        )
+
+
+def _chunk_size(requested: Optional[int], limit: int) -> int:
+    """Cap a requested request size at a server limit, or derive one from the limit."""
+    if requested is None:
+        return min(limit, MAX_AUTO_CHUNK_SIZE) if limit else DEFAULT_CHUNK_SIZE
+    return min(requested, limit) if limit else requested
@@ -1,8 +1,67 @@
+import copy
 import os
 import paramiko
+import queue
 import stat
-from typing import List, Tuple, Optional, Union
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial, wraps
+from itertools import groupby
+from typing import Callable, Iterable, Iterator, List, Tuple, Optional, Union
 from pathlib import Path
+from paramiko.message import Message
+from paramiko.sftp import CMD_ATTRS, CMD_EXTENDED, CMD_REMOVE, CMD_RENAME, CMD_STAT, CMD_STATUS, CMD_WRITE, int64
+
+from .cache import MetadataCache
+from .capabilities import POSIX_RENAME, ProbingSFTPClient, ServerCapabilities
+from .entries import EntryListing, RemoteEntry
+from .manifest import TransferManifest, file_checksum
+from .pipeline import RequestPipeline
+from .pool import ChannelPool
+from .processes import run_in_processes
+from .transfer import TransferReport, TransferResult, notify_progress, split_ranges, timed_transfer
+from .tree import normalize_remote_dir, paths_under, plan_mkdirs, same_size_and_mtime, scan_local_tree, split_changed
+from .tuning import TransferTuning
+
+
+# Bytes per range in segmented transfers
+DEFAULT_RANGE_SIZE = 16 * 1024 * 1024
+# Unacknowledged write requests allowed per handle in pipelined uploads
+DEFAULT_MAX_OUTSTANDING = 64
+# Bytes at the end of a remote partial compared before resuming an upload
+DEFAULT_TAIL_CHECK = 64 * 1024
+# Suffix of the partial file a resumable download writes to
+PARTIAL_SUFFIX = ".part"
+# Longest wait between reconnection attempts, in seconds
+MAX_RECONNECT_DELAY = 30.0
+# Largest listing iter_entries keeps for the metadata cache, in entries
+MAX_CACHED_LISTING = 10000
+
+
+def _reconnecting(method):
+    """
+    Replay an idempotent SlateSFTP method after reconnecting a lost connection.
+    
+    If the method raises or returns False and the connection turns out to
+    be gone, the client reconnects (see SlateSFTP._reconnect) and calls the
+    method again, up to reconnect_attempts times.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        replays = 0
+        while True:
+            try:
+                result = method(self, *args, **kwargs)
+            except (EOFError, OSError, paramiko.SSHException):
+                if replays >= self.reconnect_attempts or not self._connection_lost() or not self._reconnect():
+                    raise
+            else:
+                if (result is not False or replays >= self.reconnect_attempts
+                        or not self._connection_lost() or not self._reconnect()):
+                    return result
+            replays += 1
+            
+    return wrapper
 
 
 class SlateSFTP:
@@ -21,7 +80,14 @@ class SlateSFTP:
         hostname: str, 
         port: int = 22, 
         username: str = None, 
-        private_key_path: str = None
+        private_key_path: str = None,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 1024,
+        tuning: Optional[TransferTuning] = None,
+        keepalive: int = 0,
+        reconnect_attempts: int = 3,
+        reconnect_backoff: float = 1.0,
+        manifest: Optional[TransferManifest] = None
     ):
         """
         Initialize the SFTP connection to Slate.
@@ -30,7 +96,22 @@ class SlateSFTP:
             hostname: The SFTP server hostname
             port: The SFTP server port (default: 22)
             username: Your SFTP username
-            private_key_path: Path to your private key file
+            private_key_path: Path to your private key file (Ed25519, ECDSA or RSA)
+            cache_ttl: Seconds to cache remote stat results and listings
+                (default: None, caching disabled)
+            cache_size: Maximum number of cached stat results and listings (default: 1024)
+            tuning: Window/packet sizes, prefetch and chunk sizes for transfers
+                (default: paramiko's defaults, see TransferTuning)
+            keepalive: Seconds between SSH keepalive packets, so idle connections
+                are not dropped by firewalls (default: 0, disabled)
+            reconnect_attempts: Times to try reconnecting when the connection is
+                lost during an operation, which is then replayed (default: 3, 0 disables)
+            reconnect_backoff: Seconds before the first reconnection attempt,
+                doubled for each further attempt up to 30 seconds (default: 1)
+            manifest: Record of transferred files: every download and upload
+                is recorded, and download_files and download_directory skip
+                remote files already fetched unchanged (default: None, see
+                TransferManifest)
         """
         self.hostname = hostname
         self.port = port
@@ -38,6 +119,17 @@ class SlateSFTP:
         self.private_key_path = private_key_path
         self.transport = None
         self.sftp = None
+        self.cache = MetadataCache(cache_ttl, cache_size) if cache_ttl else None
+        self.tuning = tuning or TransferTuning()
+        self.keepalive = keepalive
+        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_backoff = reconnect_backoff
+        self.manifest = manifest
+        # What the server supports, probed by connect()
+        self.capabilities = None
+        # Remote directories known to exist during the current session
+        self._known_dirs = set()
+        self._owns_transport = True
         
     def connect(self) -> bool:
         """
@@ -48,22 +140,28 @@ class SlateSFTP:
         """
         try:
             # Initialize SSH transport
-            self.transport = paramiko.Transport((self.hostname, self.port))
+            self.transport = paramiko.Transport((self.hostname, self.port), **self.tuning.transport_options())
+            self.tuning.apply_security_options(self.transport)
             
             # Validate private key
             if not os.path.exists(self.private_key_path):
                 raise FileNotFoundError(f"Private key file not found at {self.private_key_path}")
                 
             try:
-                private_key = paramiko.RSAKey.from_private_key_file(self.private_key_path)
-            except paramiko.ssh_exception.PasswordRequiredException:
+                # Detects Ed25519, ECDSA and RSA keys
+                private_key = paramiko.PKey.from_path(self.private_key_path)
+            except (paramiko.ssh_exception.PasswordRequiredException, TypeError):
+                # cryptography raises TypeError for encrypted OpenSSH-format keys
                 raise ValueError("Private key is encrypted with a passphrase. Please use a key without a passphrase.")
             
             # Connect to the server
             self.transport.connect(username=self.username, pkey=private_key)
+            if self.keepalive:
+                self.transport.set_keepalive(self.keepalive)
             
-            # Create SFTP client
-            self.sftp = paramiko.SFTPClient.from_transport(self.transport)
+            # Create SFTP client and record what the server supports
+            self.sftp = ProbingSFTPClient.from_transport(self.transport, **self.tuning.channel_options())
+            self.capabilities = ServerCapabilities.probe(self.sftp)
             return True
             
         except Exception as e:
@@ -73,12 +171,26 @@ class SlateSFTP:
     
     def close(self):
         """Close the SFTP connection and transport."""
+        if not self._owns_transport:
+            # A pool worker: close only its own channel
+            if self.sftp:
+                self.sftp.close()
+                self.sftp = None
+            self.transport = None
+            return
+            
+        if self.cache:
+            self.cache.clear()
+        if self.manifest:
+            self.manifest.flush()
+        self._known_dirs.clear()
         if self.sftp:
             self.sftp.close()
             self.sftp = None
         if self.transport:
             self.transport.close()
             self.transport = None
+        self.capabilities = None
     
     def __enter__(self):
         """Support for context manager protocol."""
@@ -89,6 +201,92 @@ class SlateSFTP:
         """Support for context manager protocol."""
         self.close()
     
+    def iter_entries(self, remote_path: str = '.', read_aheads: int = 16) -> Iterator[RemoteEntry]:
+        """
+        Yield the entries of the specified path as READDIR batches arrive.
+        
+        Only a bounded number of READDIR requests are kept in flight, so
+        memory use does not grow with the size of the directory and the
+        first entries are available before the whole listing has been read.
+        Symbolic links are resolved with a stat so they report their
+        target's type; dangling links are skipped.
+        
+        With the metadata cache enabled, entries are also kept for caching
+        until the listing ends, but only up to MAX_CACHED_LISTING (10,000)
+        of them: a larger directory is not cached, so the bound holds.
+        
+        Args:
+            remote_path: The remote path to list (default: current directory)
+            read_aheads: Number of READDIR requests kept in flight (default: 16)
+            
+        Yields:
+            RemoteEntry objects, in server order with symbolic links last
+        """
+        if self.cache:
+            cached = self.cache.get_listing(remote_path)
+            if cached is not None:
+                yield from cached
+                return
+                
+        entries = [] if self.cache else None
+        for name, attr in self._iter_attributes(remote_path, read_aheads):
+            entry = RemoteEntry.from_attributes(attr, name)
+            if entries is not None:
+                entries.append(entry)
+                if len(entries) > MAX_CACHED_LISTING:
+                    # Too large to cache: stop holding on to the entries
+                    entries = None
+            yield entry
+            
+        if entries is not None:
+            self.cache.put_listing(remote_path, entries)
+    
+    @_reconnecting
+    def list_entries(self, remote_path: str = '.') -> List[RemoteEntry]:
+        """
+        List all entries in the specified path with their size, mtime and mode.
+        
+        The attributes come back with the directory listing itself, so this
+        costs one READDIR exchange instead of one stat per entry.
+        
+        Args:
+            remote_path: The remote path to list (default: current directory)
+            
+        Returns:
+            List of RemoteEntry objects
+        """
+        entries = list(self.iter_entries(remote_path))
+        if self.cache and len(entries) > MAX_CACHED_LISTING:
+            # iter_entries leaves large listings uncached; this one is in memory anyway
+            self.cache.put_listing(remote_path, entries)
+        return entries
+    
+    @_reconnecting
+    def list_columnar(self, remote_path: str = '.', read_aheads: int = 16) -> EntryListing:
+        """
+        List the specified path into a compact columnar EntryListing.
+        
+        Rows are appended straight from the READDIR attributes without
+        creating a per-entry object, which keeps million-entry listings
+        small. Filter the result with EntryListing.where().
+        
+        Args:
+            remote_path: The remote path to list (default: current directory)
+            read_aheads: Number of READDIR requests kept in flight (default: 16)
+            
+        Returns:
+            EntryListing
+        """
+        if self.cache:
+            cached = self.cache.get_listing(remote_path)
+            if cached is not None:
+                return EntryListing.from_entries(cached)
+                
+        listing = EntryListing()
+        for name, attr in self._iter_attributes(remote_path, read_aheads):
+            listing.append(name, attr.st_size, attr.st_mtime, attr.st_mode)
+        return listing
+    
     def list_directories(self, remote_path: str = '.') -> List[str]:
         """
         List all directories in the specified path.
@@ -99,19 +297,7 @@ class SlateSFTP:
         Returns:
             List of directory names
         """
-        if not self.sftp:
-            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
-            
-        directories = []
-        for entry in self.sftp.listdir(remote_path):
-            full_path = os.path.join(remote_path, entry)
-            try:
-                if stat.S_ISDIR(self.sftp.stat(full_path).st_mode):
-                    directories.append(entry)
-            except IOError:
-                continue
-                
-        return directories
+        return [entry.name for entry in self.list_entries(remote_path) if entry.is_dir]
     
     def list_files(self, remote_path: str = '.') -> List[str]:
         """
@@ -123,19 +309,7 @@ class SlateSFTP:
         Returns:
             List of filenames
         """
-        if not self.sftp:
-            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
-            
-        files = []
-        for entry in self.sftp.listdir(remote_path):
-            full_path = os.path.join(remote_path, entry)
-            try:
-                if not stat.S_ISDIR(self.sftp.stat(full_path).st_mode):
-                    files.append(entry)
-            except IOError:
-                continue
-                
-        return files
+        return [entry.name for entry in self.list_entries(remote_path) if entry.is_file]
     
     def list_all(self, remote_path: str = '.') -> Tuple[List[str], List[str]]:
         """
@@ -147,21 +321,14 @@ class SlateSFTP:
         Returns:
             Tuple of (directories, files)
         """
-        if not self.sftp:
-            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
-            
         directories = []
         files = []
         
-        for entry in self.sftp.listdir(remote_path):
-            full_path = os.path.join(remote_path, entry)
-            try:
-                if stat.S_ISDIR(self.sftp.stat(full_path).st_mode):
-                    directories.append(entry)
-                else:
-                    files.append(entry)
-            except IOError:
-                continue
+        for entry in self.list_entries(remote_path):
+            if entry.is_dir:
+                directories.append(entry.name)
+            else:
+                files.append(entry.name)
                 
         return directories, files
     
@@ -181,18 +348,184 @@ class SlateSFTP:
             
         try:
             self.sftp.mkdir(remote_path, mode)
+            if self.cache:
+                self.cache.invalidate(remote_path)
+            self._known_dirs.add(normalize_remote_dir(remote_path))
             return True
         except IOError as e:
             print(f"Failed to create directory {remote_path}: {str(e)}")
             return False
     
-    def download_file(self, remote_path: str, local_path: str) -> bool:
+    def stat_many(self, remote_paths: List[str], window: int = DEFAULT_MAX_OUTSTANDING) -> List[Optional[paramiko.SFTPAttributes]]:
+        """
+        Stat many remote paths with pipelined requests.
+        
+        Up to window STAT requests are in flight at once, so checking
+        thousands of paths costs about one round trip per window instead of
+        one per path. Paths in the metadata cache are answered from it.
+        
+        Args:
+            remote_paths: The remote paths to stat
+            window: Maximum requests awaiting a reply (default: 64)
+            
+        Returns:
+            List of SFTPAttributes, in the same order as remote_paths, with
+            None for paths that do not exist or could not be read
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        results = [self.cache.get_stat(path) if self.cache else None for path in remote_paths]
+        missing = [index for index, attributes in enumerate(results) if attributes is None]
+        replies = self._pipelined(
+            ((CMD_STAT, (self.sftp._adjust_cwd(remote_paths[index]),)) for index in missing), window
+        )
+        for index, (reply_type, msg) in zip(missing, replies):
+            if reply_type == CMD_ATTRS:
+                results[index] = paramiko.SFTPAttributes._from_msg(msg)
+                if self.cache:
+                    self.cache.put_stat(remote_paths[index], results[index])
+        return results
+    
+    def exists_many(self, remote_paths: List[str], window: int = DEFAULT_MAX_OUTSTANDING) -> List[bool]:
+        """
+        Check whether many remote paths exist, with pipelined requests (see stat_many).
+        
+        Args:
+            remote_paths: The remote paths to check
+            window: Maximum requests awaiting a reply (default: 64)
+            
+        Returns:
+            List of booleans, in the same order as remote_paths
+        """
+        return [attributes is not None for attributes in self.stat_many(remote_paths, window)]
+    
+    def remove_many(self, remote_paths: List[str], window: int = DEFAULT_MAX_OUTSTANDING) -> List[Tuple[str, bool]]:
+        """
+        Remove many remote files with pipelined requests.
+        
+        Args:
+            remote_paths: The remote files to remove
+            window: Maximum requests awaiting a reply (default: 64)
+            
+        Returns:
+            List of tuples (path, success), in the same order as remote_paths
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        replies = self._pipelined(
+            ((CMD_REMOVE, (self.sftp._adjust_cwd(path),)) for path in remote_paths), window
+        )
+        results = []
+        for path, reply in zip(remote_paths, replies):
+            if self.cache:
+                self.cache.invalidate(path)
+            results.append((path, self._reply_ok(reply, f"Failed to remove {path}")))
+        return results
+    
+    def rename_many(
+        self, renames: List[Tuple[str, str]], overwrite: bool = False, window: int = DEFAULT_MAX_OUTSTANDING
+    ) -> List[Tuple[str, bool]]:
+        """
+        Rename many remote paths with pipelined requests.
+        
+        Renamed directories are dropped from the known directories, and
+        everything cached at or below an old path is invalidated.
+        
+        Args:
+            renames: List of (old_path, new_path) tuples
+            overwrite: Replace existing destinations, using posix-rename@openssh.com
+                (default: False; raises IOError if the server does not support it)
+            window: Maximum requests awaiting a reply (default: 64)
+            
+        Returns:
+            List of tuples (old_path, success), in the same order as renames
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+        if overwrite and not self.capabilities.posix_rename:
+            raise IOError("The server does not support posix-rename@openssh.com")
+            
+        adjust = self.sftp._adjust_cwd
+        if overwrite:
+            requests = (
+                (CMD_EXTENDED, (POSIX_RENAME, adjust(old), adjust(new))) for old, new in renames
+            )
+        else:
+            requests = ((CMD_RENAME, (adjust(old), adjust(new))) for old, new in renames)
+        replies = self._pipelined(requests, window)
+        
+        results = []
+        for (old_path, new_path), reply in zip(renames, replies):
+            if self.cache:
+                self.cache.invalidate(new_path)
+            results.append((old_path, self._reply_ok(reply, f"Failed to rename {old_path} to {new_path}")))
+            
+        # A renamed directory takes its whole subtree with it
+        old_paths = [old_path for old_path, _ in renames]
+        if self.cache:
+            self.cache.invalidate_trees(old_paths)
+        for directory in paths_under(list(self._known_dirs), old_paths):
+            self._known_dirs.discard(directory)
+        return results
+    
+    def archive(
+        self, remote_paths: List[str], dest_dir: str, window: int = DEFAULT_MAX_OUTSTANDING
+    ) -> List[Tuple[str, bool]]:
+        """
+        Move many remote files into an archive directory with pipelined renames.
+        
+        dest_dir is created if needed. Each file keeps its name; when the
+        server supports posix-rename@openssh.com, a file already archived
+        under the same name is replaced, otherwise that rename fails.
+        
+        Args:
+            remote_paths: The remote files to move, e.g. files just downloaded
+            dest_dir: The remote directory to move them into
+            window: Maximum requests awaiting a reply (default: 64)
+            
+        Returns:
+            List of tuples (path, success), in the same order as remote_paths
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        self._ensure_remote_dir(dest_dir)
+        renames = [(path, os.path.join(dest_dir, os.path.basename(path))) for path in remote_paths]
+        return self.rename_many(renames, overwrite=self.capabilities.posix_rename, window=window)
+    
+    def purge(self, remote_paths: List[str], window: int = DEFAULT_MAX_OUTSTANDING) -> List[Tuple[str, bool]]:
+        """
+        Delete many remote files with pipelined requests, e.g. after downloading them.
+        
+        Args:
+            remote_paths: The remote files to delete
+            window: Maximum requests awaiting a reply (default: 64)
+            
+        Returns:
+            List of tuples (path, success), in the same order as remote_paths
+        """
+        return self.remove_many(remote_paths, window)
+    
+    @_reconnecting
+    def download_file(self, remote_path: str, local_path: str, resume: bool = False) -> bool:
         """
         Download a file from the remote server.
         
+        With resume, the file is downloaded to local_path + '.part' and
+        renamed when complete. If an interrupted download left a partial
+        file that is still consistent with the remote file (not larger, and
+        written after the remote file was last modified), the download
+        continues from the end of it instead of starting over. A local file
+        that already matches the remote size and mtime is left alone.
+        
+        With a manifest, the file is recorded in it once downloaded.
+        
         Args:
             remote_path: The path of the file on the remote server
             local_path: The path where the file should be saved locally
+            resume: Whether to resume from an earlier partial download (default: False)
             
         Returns:
             bool: True if file was downloaded successfully, False otherwise
@@ -204,24 +537,110 @@ class SlateSFTP:
             # Create local directory if it doesn't exist
             local_dir = os.path.dirname(local_path)
             if local_dir and not os.path.exists(local_dir):
-                os.makedirs(local_dir)
+                os.makedirs(local_dir, exist_ok=True)
                 
-            self.sftp.get(remote_path, local_path)
-            return True
+            if resume:
+                attributes = self._get_resumable(remote_path, local_path)
+            else:
+                attributes = self._get_file(remote_path, local_path)
         except IOError as e:
             print(f"Failed to download {remote_path} to {local_path}: {str(e)}")
             return False
+            
+        if self.manifest:
+            self._record_transfer(remote_path, local_path, attributes.st_size or 0, attributes.st_mtime)
+        return True
     
-    def download_files(self, remote_paths: List[str], local_dir: str) -> List[Tuple[str, bool]]:
+    @_reconnecting
+    def download_file_segmented(
+        self,
+        remote_path: str,
+        local_path: str,
+        max_workers: int = 4,
+        range_size: int = DEFAULT_RANGE_SIZE,
+        chunk_size: Optional[int] = None
+    ) -> bool:
+        """
+        Download a large file as byte ranges read concurrently over several channels.
+        
+        The local file is preallocated to the remote size, split into
+        ranges of range_size bytes, and each worker channel keeps taking the
+        next unread range and writes it at its offset. Every range is read
+        with pipelined requests of chunk_size bytes. With a manifest, the
+        file is recorded in it once downloaded.
+        
+        Args:
+            remote_path: The path of the file on the remote server
+            local_path: The path where the file should be saved locally
+            max_workers: Number of channels reading ranges at once (default: 4)
+            range_size: Bytes per range (default: 16 MiB)
+            chunk_size: Bytes per read request within a range (default: tuning.read_chunk_size,
+                capped at the server's max read length)
+            
+        Returns:
+            bool: True if file was downloaded successfully, False otherwise
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        try:
+            # Create local directory if it doesn't exist
+            local_dir = os.path.dirname(local_path)
+            if local_dir and not os.path.exists(local_dir):
+                os.makedirs(local_dir, exist_ok=True)
+                
+            chunk_size = self.capabilities.read_chunk_size(chunk_size or self.tuning.read_chunk_size)
+            attributes = self.sftp.stat(remote_path)
+            size = attributes.st_size
+            with open(local_path, 'wb') as local_file:
+                local_file.truncate(size)
+                
+            ranges = queue.Queue()
+            for byte_range in split_ranges(size, range_size):
+                ranges.put(byte_range)
+                
+            workers = min(max_workers, ranges.qsize())
+            if workers <= 1:
+                self._download_ranges(remote_path, local_path, ranges, chunk_size)
+            else:
+                with ChannelPool(self, workers) as pool:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(pool.run, "_download_ranges", remote_path, local_path, ranges, chunk_size)
+                            for _ in range(workers)
+                        ]
+                        for future in futures:
+                            future.result()
+                            
+            if self.manifest:
+                self._record_transfer(remote_path, local_path, size, attributes.st_mtime)
+            return True
+        except Exception as e:
+            print(f"Failed to download {remote_path} to {local_path}: {str(e)}")
+            return False
+    
+    def download_files(
+        self, remote_paths: List[str], local_dir: str, max_workers: int = 1, resume: bool = False
+    ) -> List[Tuple[str, bool]]:
         """
         Download multiple files from the remote server.
         
+        With a manifest, the files are stat'ed in one pipelined batch, and a
+        file is skipped when the manifest has it with the same size and
+        mtime and its local copy is still there with that size. Skipped
+        files are listed in the report's skipped rather than its results.
+        
         Args:
             remote_paths: List of paths of files on the remote server
             local_dir: The local directory where files should be saved
+            max_workers: Number of files to download at once, each over its
+                own SFTP channel (default: 1)
+            resume: Whether to resume interrupted downloads (default: False, see download_file)
             
         Returns:
-            List of tuples (filename, success) indicating which files were successfully downloaded
+            TransferReport: a list of tuples (filename, success) indicating which
+            files were successfully downloaded, with per-file details in
+            .results and aggregate numbers such as .throughput
         """
         if not self.sftp:
             raise ConnectionError("Not connected to SFTP server. Call connect() first.")
@@ -230,23 +649,183 @@ class SlateSFTP:
         if not os.path.exists(local_dir):
             os.makedirs(local_dir)
             
-        results = []
-        for remote_path in remote_paths:
-            filename = os.path.basename(remote_path)
-            local_path = os.path.join(local_dir, filename)
-            success = self.download_file(remote_path, local_path)
-            results.append((filename, success))
+        jobs = [
+            (remote_path, os.path.join(local_dir, os.path.basename(remote_path)))
+            for remote_path in remote_paths
+        ]
+        if not self.manifest:
+            return self._run_transfers("_download_prepared", jobs, max_workers, local_side=1, resume=resume)
             
-        return results
+        # Remote size and mtime of the files to download, by remote path
+        listed = {}
+        for job, attributes in zip(jobs, self.stat_many(remote_paths)):
+            if attributes is not None:
+                listed[job[0]] = (attributes.st_size or 0, attributes.st_mtime or 0)
+        skipped = [
+            remote_path for remote_path, local_path in jobs
+            if remote_path in listed and self._already_downloaded(remote_path, local_path, *listed[remote_path])
+        ]
+        skipped_paths = set(skipped)
+        report = self._run_transfers(
+            "_download_prepared", [job for job in jobs if job[0] not in skipped_paths], max_workers, local_side=1,
+            resume=resume, progress=lambda result: self._remember_download(result, listed.get(result.source))
+        )
+        report.skipped = skipped
+        return report
+    
+    def walk(
+        self,
+        remote_dir: str,
+        max_workers: int = 1,
+        max_depth: Optional[int] = None,
+        onerror=None
+    ) -> Iterator[Tuple[str, List[RemoteEntry], List[RemoteEntry]]]:
+        """
+        Walk a remote directory tree, like os.walk.
+        
+        Each directory is read with a single attribute-bearing listing. With
+        max_workers > 1 several directories are listed at once over their
+        own SFTP channels, and directories are yielded as their listings
+        complete rather than in a fixed order.
+        
+        Args:
+            remote_dir: The remote directory to start from
+            max_workers: Number of directories to list at once (default: 1)
+            max_depth: How many levels below remote_dir to descend
+                (default: None, no limit; 0 lists only remote_dir itself)
+            onerror: Called with (path, exception) when a subdirectory cannot be
+                listed (default: skip it silently). Errors listing remote_dir
+                itself are raised.
+            
+        Yields:
+            Tuples of (dirpath, directories, files), where directories and
+            files are lists of RemoteEntry
+        """
+        return self._walk(remote_dir, max_workers, max_depth, onerror)
     
-    def download_directory(self, remote_dir: str, local_dir: str, recursive: bool = True) -> bool:
+    def _walk(
+        self,
+        remote_dir: str,
+        max_workers: int = 1,
+        max_depth: Optional[int] = None,
+        onerror=None,
+        pool: Optional[ChannelPool] = None
+    ) -> Iterator[Tuple[str, List[RemoteEntry], List[RemoteEntry]]]:
+        """
+        walk(), optionally listing on the channels of an existing pool.
+        
+        Args:
+            remote_dir, max_workers, max_depth, onerror: As for walk()
+            pool: Channels to list on, e.g. shared with the transfers of
+                download_directory (default: open max_workers of its own)
+            
+        Yields:
+            As walk()
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        def split(path, depth, entries):
+            directories = [entry for entry in entries if entry.is_dir]
+            files = [entry for entry in entries if not entry.is_dir]
+            children = []
+            if max_depth is None or depth < max_depth:
+                children = [(os.path.join(path, entry.name), depth + 1) for entry in directories]
+            return (path, directories, files), children
+            
+        def failed(path, depth, error):
+            if depth == 0:
+                raise error
+            if onerror is not None:
+                onerror(path, error)
+                
+        if max_workers <= 1:
+            stack = [(remote_dir, 0)]
+            while stack:
+                path, depth = stack.pop()
+                try:
+                    entries = self.list_entries(path)
+                except IOError as e:
+                    failed(path, depth, e)
+                    continue
+                result, children = split(path, depth, entries)
+                yield result
+                stack.extend(reversed(children))
+            return
+            
+        own_pool = pool is None
+        if own_pool:
+            pool = ChannelPool(self, max_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = {executor.submit(pool.run, "list_entries", remote_dir): (remote_dir, 0)}
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path, depth = pending.pop(future)
+                        try:
+                            entries = future.result()
+                        except IOError as e:
+                            failed(path, depth, e)
+                            continue
+                        result, children = split(path, depth, entries)
+                        for child in children:
+                            pending[executor.submit(pool.run, "list_entries", child[0])] = child
+                        yield result
+        finally:
+            if own_pool:
+                pool.close()
+    
+    @_reconnecting
+    def download_directory(
+        self,
+        remote_dir: str,
+        local_dir: str,
+        recursive: bool = True,
+        max_workers: int = 1,
+        max_depth: Optional[int] = None,
+        resume: bool = False,
+        processes: int = 0,
+        progress: Optional[Callable[[TransferResult], None]] = None,
+        mirror: bool = False
+    ) -> bool:
         """
         Download an entire directory from the remote server.
         
+        The tree is read with walk() while the files it finds are fed
+        through a bounded queue to the transfer workers, so downloads start
+        before the whole tree has been listed.
+        
+        With mirror, a file whose local copy already has the remote size
+        and mtime (taken from the directory listing, so no extra requests)
+        is skipped, and each downloaded file gets the remote mtime, so a
+        repeated mirror of an unchanged tree costs only the listings.
+        
+        With a manifest, a file the manifest has with the listed size and
+        mtime is skipped as long as its local copy still has that size, and
+        every file downloaded is recorded in it.
+        
+        With processes, the files are downloaded by that many worker
+        processes, each with its own connection, so encryption is spread
+        over several CPU cores. Scripts using it must guard their entry
+        point with if __name__ == '__main__'.
+        
         Args:
             remote_dir: The path of the directory on the remote server
             local_dir: The path where the directory should be saved locally
             recursive: Whether to download subdirectories (default: True)
+            max_workers: Number of directories to list and files to download
+                at once (default: 1). Listings and downloads share one pool of
+                max_workers channels, so the connection uses max_workers + 1
+                SFTP channels in all; keep it below the server's session
+                limit (MaxSessions, 10 by default in OpenSSH)
+            max_depth: How many levels of subdirectories to descend
+                (default: None, no limit; ignored if recursive is False)
+            resume: Whether to resume interrupted downloads (default: False, see download_file)
+            processes: Number of worker processes downloading files (default: 0,
+                download in this process with max_workers channels)
+            progress: Called with each file's TransferResult as it finishes
+            mirror: Whether to skip files whose local copy is unchanged (default: False)
             
         Returns:
             bool: True if directory was downloaded successfully, False otherwise
@@ -254,36 +833,97 @@ class SlateSFTP:
         if not self.sftp:
             raise ConnectionError("Not connected to SFTP server. Call connect() first.")
             
+        # Remote mtimes of the files being mirrored, by local path
+        mtimes = {}
+        # Remote size and mtime of the files being downloaded, by remote path
+        listed = {}
+        unchanged = 0
+        recorded = 0
+        
+        def skipped(path, error):
+            print(f"Failed to download directory {path}: {str(error)}")
+            
+        def jobs():
+            nonlocal unchanged, recorded
+            tree = self._walk(remote_dir, max_workers, max_depth if recursive else 0, skipped, pool)
+            for dirpath, _, files in tree:
+                local_path = os.path.normpath(os.path.join(local_dir, os.path.relpath(dirpath, remote_dir)))
+                os.makedirs(local_path, exist_ok=True)
+                for entry in files:
+                    remote_file = os.path.join(dirpath, entry.name)
+                    local_file = os.path.join(local_path, entry.name)
+                    if self.manifest:
+                        if self._already_downloaded(remote_file, local_file, entry.size, entry.mtime):
+                            recorded += 1
+                            continue
+                        listed[remote_file] = (entry.size, entry.mtime)
+                    if mirror:
+                        try:
+                            if same_size_and_mtime(os.stat(local_file), entry.size, entry.mtime):
+                                unchanged += 1
+                                continue
+                        except OSError:
+                            pass
+                        mtimes[local_file] = entry.mtime
+                    yield remote_file, local_file
+                    
+        def finished(result):
+            # A failed file keeps its mtime in case _run_transfers replays it
+            if result.success:
+                mtime = mtimes.pop(result.destination, None)
+                if mtime is not None:
+                    os.utime(result.destination, (mtime, mtime))
+                if self.manifest:
+                    self._remember_download(result, listed.pop(result.source, None))
+            if progress:
+                progress(result)
+                
+        pool = None
         try:
             # Create local directory if it doesn't exist
             if not os.path.exists(local_dir):
                 os.makedirs(local_dir)
                 
-            for item in self.sftp.listdir(remote_dir):
-                remote_path = os.path.join(remote_dir, item)
-                local_path = os.path.join(local_dir, item)
-                
-                try:
-                    if stat.S_ISDIR(self.sftp.stat(remote_path).st_mode):
-                        if recursive:
-                            self.download_directory(remote_path, local_path, recursive)
-                    else:
-                        self.download_file(remote_path, local_path)
-                except IOError:
-                    continue
-                    
+            if max_workers > 1:
+                # One set of channels for both the listings and the downloads
+                pool = ChannelPool(self, max_workers)
+            report = self._run_transfers(
+                "_download_prepared", jobs(), max_workers, local_side=1,
+                processes=processes, progress=finished if mirror or self.manifest else progress,
+                pool=pool, resume=resume
+            )
+            if mirror:
+                print(f"Mirrored {remote_dir}: {report.succeeded} of {len(report)} new or changed files "
+                      f"downloaded, {unchanged} unchanged")
+            if recorded:
+                print(f"Skipped {recorded} files already in the transfer manifest")
             return True
         except Exception as e:
             print(f"Failed to download directory {remote_dir}: {str(e)}")
             return False
+        finally:
+            if pool is not None:
+                pool.close()
     
-    def upload_file(self, local_path: str, remote_path: str) -> bool:
+    @_reconnecting
+    def upload_file(
+        self, local_path: str, remote_path: str, resume: bool = False, verify_tail: int = DEFAULT_TAIL_CHECK
+    ) -> bool:
         """
         Upload a file to the remote server.
         
+        With resume, an existing remote file shorter than the local one is
+        treated as an interrupted upload: its last verify_tail bytes are
+        compared with the same bytes of the local file and, if they match,
+        only the missing bytes are sent. Otherwise the file is uploaded in
+        full.
+        
         Args:
             local_path: The path of the file on the local system
             remote_path: The path where the file should be saved on the remote server
+            resume: Whether to continue an earlier partial upload (default: False)
+            verify_tail: Bytes at the end of the remote partial to check
+                before resuming (default: 64 KiB, 0 to skip the check)
             
         Returns:
             bool: True if file was uploaded successfully, False otherwise
@@ -296,61 +936,186 @@ class SlateSFTP:
                 raise FileNotFoundError(f"Local file not found: {local_path}")
                 
             # Create remote directory structure if needed
-            remote_dir = os.path.dirname(remote_path)
-            if remote_dir:
-                try:
-                    self.sftp.stat(remote_dir)
-                except IOError:
-                    # Directory doesn't exist, create it
-                    self._mkdir_p(remote_dir)
+            self._ensure_remote_dir(os.path.dirname(remote_path))
                     
-            self.sftp.put(local_path, remote_path)
+            self._put_file(local_path, remote_path, resume, verify_tail)
+        except Exception as e:
+            print(f"Failed to upload {local_path} to {remote_path}: {str(e)}")
+            return False
+            
+        if self.manifest:
+            self._remember_uploads([(local_path, remote_path)])
+        return True
+    
+    @_reconnecting
+    def upload_file_segmented(
+        self,
+        local_path: str,
+        remote_path: str,
+        max_workers: int = 4,
+        range_size: int = DEFAULT_RANGE_SIZE,
+        chunk_size: Optional[int] = None,
+        max_outstanding: int = DEFAULT_MAX_OUTSTANDING
+    ) -> bool:
+        """
+        Upload a large file as byte ranges written concurrently through several handles.
+        
+        The remote file is created once, then up to max_workers channels each
+        open their own write handle on it and keep taking the next unwritten
+        range of range_size bytes. Each handle writes its range in requests
+        of chunk_size bytes with up to max_outstanding of them awaiting an
+        acknowledgement, so the link stays busy instead of waiting a round
+        trip per write.
+        
+        Args:
+            local_path: The path of the file on the local system
+            remote_path: The path where the file should be saved on the remote server
+            max_workers: Number of handles writing ranges at once (default: 4)
+            range_size: Bytes per range (default: 16 MiB)
+            chunk_size: Bytes per write request (default: tuning.write_chunk_size,
+                capped at the server's max write length)
+            max_outstanding: Unacknowledged write requests allowed per handle (default: 64)
+            
+        Returns:
+            bool: True if file was uploaded successfully, False otherwise
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        try:
+            if not os.path.exists(local_path):
+                raise FileNotFoundError(f"Local file not found: {local_path}")
+                
+            # Create remote directory structure if needed
+            self._ensure_remote_dir(os.path.dirname(remote_path))
+            
+            # Create (or truncate) the remote file once; the workers open it
+            # for writing without truncating
+            chunk_size = self.capabilities.write_chunk_size(chunk_size or self.tuning.write_chunk_size)
+            size = os.path.getsize(local_path)
+            with self.sftp.open(remote_path, 'wb'):
+                pass
+            if self.cache:
+                self.cache.invalidate(remote_path)
+                
+            ranges = queue.Queue()
+            for byte_range in split_ranges(size, range_size):
+                ranges.put(byte_range)
+                
+            workers = min(max_workers, ranges.qsize())
+            if workers <= 1:
+                self._upload_ranges(local_path, remote_path, ranges, chunk_size, max_outstanding)
+            else:
+                with ChannelPool(self, workers) as pool:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(
+                                pool.run, "_upload_ranges", local_path, remote_path, ranges, chunk_size, max_outstanding
+                            )
+                            for _ in range(workers)
+                        ]
+                        for future in futures:
+                            future.result()
+                            
+            attributes = self.sftp.stat(remote_path)
+            if attributes.st_size != size:
+                raise IOError(f"Size mismatch after upload: local {size}, remote {attributes.st_size}")
+            if self.manifest:
+                self._record_transfer(remote_path, local_path, size, attributes.st_mtime)
             return True
         except Exception as e:
             print(f"Failed to upload {local_path} to {remote_path}: {str(e)}")
             return False
     
-    def upload_files(self, local_paths: List[str], remote_dir: str) -> List[Tuple[str, bool]]:
+    def upload_files(
+        self, local_paths: List[str], remote_dir: str, max_workers: int = 1, resume: bool = False
+    ) -> List[Tuple[str, bool]]:
         """
         Upload multiple files to the remote server.
         
+        The remote directory is prepared once up front and each local file
+        is checked once, so the per-file cost is just the transfer.
+        
         Args:
             local_paths: List of paths of files on the local system
             remote_dir: The directory on the remote server where files should be saved
+            max_workers: Number of files to upload at once, each over its
+                own SFTP channel on this connection (default: 1)
+            resume: Whether to continue interrupted uploads (default: False, see upload_file)
             
         Returns:
-            List of tuples (filename, success) indicating which files were successfully uploaded
+            TransferReport: a list of tuples (filename, success) indicating which
+            files were successfully uploaded, with per-file details in
+            .results and aggregate numbers such as .throughput
         """
         if not self.sftp:
             raise ConnectionError("Not connected to SFTP server. Call connect() first.")
             
         # Ensure remote directory exists
-        try:
-            self.sftp.stat(remote_dir)
-        except IOError:
-            self._mkdir_p(remote_dir)
+        self._ensure_remote_dir(remote_dir)
             
-        results = []
-        for local_path in local_paths:
-            if not os.path.exists(local_path):
-                results.append((os.path.basename(local_path), False))
-                continue
-                
-            filename = os.path.basename(local_path)
-            remote_path = os.path.join(remote_dir, filename)
-            success = self.upload_file(local_path, remote_path)
-            results.append((filename, success))
+        jobs = [
+            (local_path, os.path.join(remote_dir, os.path.basename(local_path)))
+            for local_path in local_paths
+        ]
+        found = [os.path.exists(local_path) for local_path in local_paths]
+        transferred = self._run_transfers(
+            "_upload_prepared", [job for job, exists in zip(jobs, found) if exists], max_workers, local_side=0,
+            resume=resume
+        )
+        if self.manifest:
+            self._remember_uploads(
+                (result.source, result.destination) for result in transferred.results if result.success
+            )
+        
+        # Merge the missing files back in, keeping the input order
+        report = TransferReport()
+        report.elapsed = transferred.elapsed
+        results = iter(transferred.results)
+        for (local_path, remote_path), exists in zip(jobs, found):
+            if exists:
+                report.add(next(results))
+            else:
+                report.add(TransferResult(os.path.basename(local_path), local_path, remote_path, False))
             
-        return results
+        return report
     
-    def upload_directory(self, local_dir: str, remote_dir: str, recursive: bool = True) -> bool:
+    @_reconnecting
+    def upload_directory(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        recursive: bool = True,
+        max_workers: int = 1,
+        resume: bool = False,
+        processes: int = 0,
+        progress: Optional[Callable[[TransferResult], None]] = None,
+        push: bool = False
+    ) -> bool:
         """
         Upload an entire directory to the remote server.
         
+        The local tree is scanned once with os.scandir, the remote
+        directories are created parents-first, and then the files are
+        transferred, optionally by worker processes as in download_directory.
+        
+        With push, the remote tree is first listed once with walk(), and a
+        sorted merge of that listing with the local scan picks out the files
+        that are new or differ in size or mtime; only those are sent, each
+        given the local mtime so the next push finds it unchanged. The bytes
+        not sent are reported when the push finishes.
+        
         Args:
             local_dir: The path of the directory on the local system
             remote_dir: The path where the directory should be saved on the remote server
             recursive: Whether to upload subdirectories (default: True)
+            max_workers: Number of directories to create and files to upload
+                at once (default: 1)
+            resume: Whether to continue interrupted uploads (default: False, see upload_file)
+            processes: Number of worker processes uploading files (default: 0,
+                upload in this process with max_workers channels)
+            progress: Called with each file's TransferResult as it finishes
+            push: Whether to send only new or changed files (default: False)
             
         Returns:
             bool: True if directory was uploaded successfully, False otherwise
@@ -362,27 +1127,837 @@ class SlateSFTP:
             if not os.path.exists(local_dir):
                 raise FileNotFoundError(f"Local directory not found: {local_dir}")
                 
-            # Ensure remote directory exists
+            files = []
+            remote_dirs = []
+            for relative_dir, _, filenames in scan_local_tree(local_dir, recursive):
+                remote_path = os.path.join(remote_dir, relative_dir) if relative_dir else remote_dir
+                remote_dirs.append(remote_path)
+                for filename in filenames:
+                    files.append((
+                        os.path.join(local_dir, relative_dir, filename),
+                        os.path.join(remote_path, filename),
+                    ))
+                    
+            if push:
+                total = len(files)
+                files, unchanged = self._push_plan(files, remote_dir, recursive, max_workers)
+                
+            # Create (or confirm) every remote directory once, before any
+            # file is transferred
+            self.prepare_directories(remote_dirs, max_workers)
+                
+            report = self._run_transfers(
+                "_upload_prepared", files, max_workers, local_side=0,
+                processes=processes, progress=progress, resume=resume, preserve_mtime=push
+            )
+            if self.manifest:
+                self._remember_uploads(
+                    (result.source, result.destination) for result in report.results if result.success
+                )
+            if push:
+                print(f"Pushed {local_dir}: {report.succeeded} of {len(files)} new or changed files uploaded "
+                      f"({report.bytes_transferred:,} bytes), {len(unchanged)} of {total} unchanged "
+                      f"({sum(size for _, size in unchanged):,} bytes not sent)")
+            return True
+        except Exception as e:
+            print(f"Failed to upload directory {local_dir}: {str(e)}")
+            return False
+    
+    def _push_plan(
+        self, files: List[Tuple[str, str]], remote_dir: str, recursive: bool, max_workers: int
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, int]]]:
+        """
+        Pick the upload jobs whose remote copy is missing or differs, for push mode.
+        
+        The remote tree is listed once with walk(); the directories it lists
+        are remembered as existing, so preparing them afterwards is free.
+        
+        Args:
+            files: The (local_path, remote_path) upload jobs under remote_dir
+            remote_dir: The remote directory being pushed to
+            recursive: Whether subdirectories are being uploaded
+            max_workers: Number of directories to list at once
+            
+        Returns:
+            Tuple of (jobs to send, (relative_path, size) of each unchanged file)
+        """
+        remote_files = []
+        try:
+            for dirpath, _, entries in self.walk(remote_dir, max_workers, None if recursive else 0):
+                self._known_dirs.add(normalize_remote_dir(dirpath))
+                relative_dir = os.path.relpath(dirpath, remote_dir)
+                for entry in entries:
+                    remote_files.append(
+                        (os.path.normpath(os.path.join(relative_dir, entry.name)), entry.size, entry.mtime)
+                    )
+        except IOError:
+            # remote_dir does not exist yet, so every file is new
+            pass
+            
+        jobs = {}
+        local_files = []
+        for local_path, remote_path in files:
+            relative_path = os.path.relpath(remote_path, remote_dir)
+            local_stat = os.stat(local_path)
+            jobs[relative_path] = (local_path, remote_path)
+            local_files.append((relative_path, local_stat.st_size, local_stat.st_mtime))
+            
+        remote_files.sort()
+        local_files.sort()
+        changed, unchanged = split_changed(local_files, remote_files)
+        return [jobs[relative_path] for relative_path in changed], unchanged
+    
+    def prepare_directories(self, remote_dirs: List[str], max_workers: int = 1) -> List[str]:
+        """
+        Make sure a set of remote directories exist, creating what is missing.
+        
+        The minimal list of directories is planned up front (see
+        tree.plan_mkdirs) and handled one depth level at a time, so a
+        directory is only created after its parent. Directories already
+        known to exist in this session are skipped, and children of a
+        directory created here are created without checking for them first.
+        
+        Args:
+            remote_dirs: Remote directories that must exist
+            max_workers: Number of directories of the same level to handle at once (default: 1)
+            
+        Returns:
+            List of directories that were created
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        plan = plan_mkdirs(remote_dirs, self._known_dirs)
+        levels = [list(group) for _, group in groupby(plan, key=lambda path: path.count("/"))]
+        created = []
+        created_set = set()
+        
+        def prepare_level(mapper, level):
+            parent_created = [os.path.dirname(path) in created_set for path in level]
+            for path, made in zip(level, list(mapper(level, parent_created))):
+                if made:
+                    created.append(path)
+                    created_set.add(path)
+                    
+        workers = min(max_workers, max((len(level) for level in levels), default=0))
+        if workers <= 1:
+            for level in levels:
+                prepare_level(partial(map, self._make_planned_dir), level)
+        else:
+            with ChannelPool(self, workers) as pool:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    make_dir = partial(pool.run, "_make_planned_dir")
+                    for level in levels:
+                        prepare_level(partial(executor.map, make_dir), level)
+            
+        return created
+    
+    def _make_planned_dir(self, remote_dir: str, parent_created: bool) -> bool:
+        """
+        Create one directory of a mkdir plan unless it already exists.
+        
+        Args:
+            remote_dir: The remote directory to create
+            parent_created: True if its parent was just created, so it cannot exist yet
+            
+        Returns:
+            bool: True if the directory was created, False if it already existed
+        """
+        if not parent_created:
             try:
-                self.sftp.stat(remote_dir)
+                self._stat(remote_dir)
+                self._known_dirs.add(remote_dir)
+                return False
             except IOError:
-                self._mkdir_p(remote_dir)
-                
-            for item in os.listdir(local_dir):
-                local_path = os.path.join(local_dir, item)
-                remote_path = os.path.join(remote_dir, item)
+                pass
                 
-                if os.path.isdir(local_path):
-                    if recursive:
-                        self.upload_directory(local_path, remote_path, recursive)
-                else:
-                    self.upload_file(local_path, remote_path)
+        self.sftp.mkdir(remote_dir)
+        if self.cache:
+            self.cache.invalidate(remote_dir)
+        self._known_dirs.add(remote_dir)
+        return True
+    
+    def _put_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        resume: bool = False,
+        verify_tail: int = DEFAULT_TAIL_CHECK,
+        preserve_mtime: bool = False
+    ):
+        """
+        Transfer a local file to a remote path whose directory already exists.
+        
+        Args:
+            local_path: The path of the file on the local system
+            remote_path: The path where the file should be saved on the remote server
+            resume: Whether to continue an earlier partial upload
+            verify_tail: Bytes at the end of the remote partial to check before resuming
+            preserve_mtime: Whether to give the remote file the local file's mtime
+        """
+        offset = self._upload_resume_offset(local_path, remote_path, verify_tail) if resume else 0
+        if offset:
+            size = os.path.getsize(local_path)
+            if offset < size:
+                print(f"Resuming {remote_path} at byte {offset:,} of {size:,}")
+                ranges = queue.Queue()
+                ranges.put((offset, size - offset))
+                self._upload_ranges(
+                    local_path, remote_path, ranges,
+                    self.capabilities.write_chunk_size(self.tuning.write_chunk_size), DEFAULT_MAX_OUTSTANDING
+                )
+                remote_size = self.sftp.stat(remote_path).st_size
+                if remote_size != size:
+                    raise IOError(f"Size mismatch after upload: local {size}, remote {remote_size}")
+        else:
+            self._put_stream(local_path, remote_path)
+        if preserve_mtime:
+            local_stat = os.stat(local_path)
+            self.sftp.utime(remote_path, (local_stat.st_atime, local_stat.st_mtime))
+        if self.cache:
+            self.cache.invalidate(remote_path)
+    
+    def _upload_resume_offset(self, local_path: str, remote_path: str, verify_tail: int) -> int:
+        """
+        Work out where an interrupted upload of local_path can continue.
+        
+        Args:
+            local_path: The path of the file on the local system
+            remote_path: The remote file that may hold a partial upload
+            verify_tail: Bytes at the end of the remote partial to compare with the local file
+            
+        Returns:
+            int: The offset to continue from, or 0 to upload the whole file
+        """
+        try:
+            remote_size = self.sftp.stat(remote_path).st_size
+        except IOError:
+            return 0
+            
+        if not remote_size or remote_size > os.path.getsize(local_path):
+            return 0
+            
+        if verify_tail:
+            length = min(verify_tail, remote_size)
+            with open(local_path, 'rb') as local_file, self.sftp.open(remote_path, 'rb') as remote_file:
+                local_file.seek(remote_size - length)
+                remote_file.seek(remote_size - length)
+                if local_file.read(length) != remote_file.read(length):
+                    # The remote partial is not a prefix of this file
+                    return 0
                     
+        return remote_size
+    
+    def _upload_prepared(self, local_path: str, remote_path: str, **options) -> bool:
+        """
+        Upload a file whose local existence and remote directory were already checked.
+        
+        Args:
+            local_path: The path of the file on the local system
+            remote_path: The path where the file should be saved on the remote server
+            **options: resume/verify_tail/preserve_mtime, as for _put_file
+            
+        Returns:
+            bool: True if file was uploaded successfully, False otherwise
+        """
+        try:
+            self._put_file(local_path, remote_path, **options)
             return True
         except Exception as e:
-            print(f"Failed to upload directory {local_dir}: {str(e)}")
+            print(f"Failed to upload {local_path} to {remote_path}: {str(e)}")
+            return False
+    
+    @_reconnecting
+    def _download_prepared(self, remote_path: str, local_path: str, resume: bool = False) -> bool:
+        """
+        Download a file whose local directory was already created.
+        
+        Unlike download_file it does not record the file in the manifest;
+        the bulk download running it does that in this process.
+        
+        Args:
+            remote_path: The path of the file on the remote server
+            local_path: The path where the file should be saved locally
+            resume: Whether to resume from an earlier partial download (default: False)
+            
+        Returns:
+            bool: True if file was downloaded successfully, False otherwise
+        """
+        try:
+            if resume:
+                self._get_resumable(remote_path, local_path)
+            else:
+                self._get_file(remote_path, local_path)
+            return True
+        except IOError as e:
+            print(f"Failed to download {remote_path} to {local_path}: {str(e)}")
+            return False
+    
+    def _get_file(self, remote_path: str, local_path: str):
+        """
+        Download a whole file using the tuning profile's prefetch and chunk settings.
+        
+        Args:
+            remote_path: The path of the file on the remote server
+            local_path: The path where the file should be saved locally
+            
+        Returns:
+            paramiko.SFTPAttributes: The remote file's attributes when it was opened
+        """
+        with self.sftp.open(remote_path, 'rb') as remote_file:
+            attributes = remote_file.stat()
+            size = attributes.st_size
+            with open(local_path, 'wb') as local_file:
+                self._copy_from_remote(remote_file, local_file, 0, size)
+                
+        local_size = os.path.getsize(local_path)
+        if local_size != size:
+            raise IOError(f"Size mismatch in download: remote {size}, local {local_size}")
+        return attributes
+    
+    def _copy_from_remote(self, remote_file: paramiko.SFTPFile, local_file, offset: int, size: int):
+        """
+        Copy an open remote file from offset to its end into an open local file.
+        
+        Args:
+            remote_file: The remote file, opened for reading
+            local_file: The local file, positioned where the data should go
+            offset: Byte offset in the remote file to start from
+            size: Size of the remote file
+        """
+        tuning = self.tuning
+        chunk_size = self.capabilities.read_chunk_size(tuning.read_chunk_size)
+        remote_file.MAX_REQUEST_SIZE = chunk_size
+        remote_file.seek(offset)
+        if tuning.prefetch and offset < size:
+            remote_file.prefetch(size, tuning.max_concurrent_prefetch_requests)
+        while True:
+            data = remote_file.read(chunk_size)
+            if not data:
+                break
+            local_file.write(data)
+    
+    def _put_stream(self, local_path: str, remote_path: str):
+        """
+        Upload a whole file with pipelined writes of the tuning profile's chunk size.
+        
+        Args:
+            local_path: The path of the file on the local system
+            remote_path: The path where the file should be saved on the remote server
+        """
+        chunk_size = self.capabilities.write_chunk_size(self.tuning.write_chunk_size)
+        size = os.path.getsize(local_path)
+        with open(local_path, 'rb') as local_file, self.sftp.open(remote_path, 'wb') as remote_file:
+            remote_file.MAX_REQUEST_SIZE = chunk_size
+            remote_file.set_pipelined(True)
+            while True:
+                data = local_file.read(chunk_size)
+                if not data:
+                    break
+                remote_file.write(data)
+                
+        remote_size = self.sftp.stat(remote_path).st_size
+        if remote_size != size:
+            raise IOError(f"Size mismatch after upload: local {size}, remote {remote_size}")
+    
+    def _get_resumable(self, remote_path: str, local_path: str):
+        """
+        Download a file through a '.part' file, continuing an earlier partial download.
+        
+        If the server does not report the remote mtime, neither an existing
+        local copy nor a partial can be checked against it, so the file is
+        downloaded from the start and keeps its local modification time.
+        
+        Args:
+            remote_path: The path of the file on the remote server
+            local_path: The path where the file should be saved locally
+            
+        Returns:
+            paramiko.SFTPAttributes: The remote file's attributes before the download
+        """
+        attributes = self.sftp.stat(remote_path)
+        size, mtime = attributes.st_size, attributes.st_mtime
+        
+        if mtime is not None and os.path.exists(local_path):
+            local_stat = os.stat(local_path)
+            if local_stat.st_size == size and int(local_stat.st_mtime) == mtime:
+                # Already downloaded
+                return attributes
+                
+        part_path = local_path + PARTIAL_SUFFIX
+        offset = 0
+        if mtime is not None and os.path.exists(part_path):
+            part_stat = os.stat(part_path)
+            # A partial written after the remote file last changed, and not
+            # longer than it, is a prefix of the current remote content
+            if part_stat.st_size <= size and part_stat.st_mtime >= mtime:
+                offset = part_stat.st_size
+                print(f"Resuming {remote_path} at byte {offset:,} of {size:,}")
+                
+        with open(part_path, 'ab' if offset else 'wb') as local_file:
+            if offset < size:
+                with self.sftp.open(remote_path, 'rb') as remote_file:
+                    self._copy_from_remote(remote_file, local_file, offset, size)
+                
+        part_size = os.path.getsize(part_path)
+        if part_size != size:
+            raise IOError(f"Size mismatch in download: remote {size}, local {part_size}")
+        os.replace(part_path, local_path)
+        if mtime is not None:
+            os.utime(local_path, (attributes.st_atime or mtime, mtime))
+        return attributes
+    
+    def _download_ranges(self, remote_path: str, local_path: str, ranges: queue.Queue, chunk_size: int):
+        """
+        Read byte ranges of a remote file into the same offsets of a local file.
+        
+        Keeps taking (offset, length) ranges from the queue until it is
+        empty, so faster channels end up reading more of the file.
+        
+        Args:
+            remote_path: The path of the file on the remote server
+            local_path: The preallocated local file to write into
+            ranges: Queue of (offset, length) tuples shared between workers
+            chunk_size: Bytes per pipelined read request
+        """
+        max_requests = self.tuning.max_concurrent_prefetch_requests
+        with self.sftp.open(remote_path, 'rb') as remote_file, open(local_path, 'r+b') as local_file:
+            remote_file.MAX_REQUEST_SIZE = chunk_size
+            while True:
+                try:
+                    offset, length = ranges.get_nowait()
+                except queue.Empty:
+                    return
+                    
+                chunks = split_ranges(length, chunk_size)
+                local_file.seek(offset)
+                for (chunk_offset, chunk_length), data in zip(
+                    chunks, remote_file.readv([(offset + o, n) for o, n in chunks], max_requests)
+                ):
+                    if len(data) != chunk_length:
+                        raise IOError(f"Short read at offset {offset + chunk_offset} of {remote_path}")
+                    local_file.write(data)
+    
+    def _upload_ranges(
+        self, local_path: str, remote_path: str, ranges: queue.Queue, chunk_size: int, max_outstanding: int
+    ):
+        """
+        Write byte ranges of a local file to the same offsets of a remote file.
+        
+        Keeps taking (offset, length) ranges from the queue until it is
+        empty. Writes are pipelined with at most max_outstanding requests
+        awaiting an acknowledgement; any failed write raises.
+        
+        Args:
+            local_path: The path of the file on the local system
+            remote_path: The existing remote file to write into
+            ranges: Queue of (offset, length) tuples shared between workers
+            chunk_size: Bytes per write request
+            max_outstanding: Maximum unacknowledged write requests
+        """
+        with open(local_path, 'rb') as local_file, self.sftp.open(remote_path, 'r+b') as remote_file:
+            pipeline = RequestPipeline(self.sftp, max_outstanding)
+            while True:
+                try:
+                    offset, length = ranges.get_nowait()
+                except queue.Empty:
+                    break
+                    
+                local_file.seek(offset)
+                for chunk_offset, chunk_length in split_ranges(length, chunk_size):
+                    data = local_file.read(chunk_length)
+                    if len(data) != chunk_length:
+                        raise IOError(f"{local_path} changed size during upload")
+                    pipeline.submit(CMD_WRITE, remote_file.handle, int64(offset + chunk_offset), data)
+                    for _, reply_type, msg in pipeline.completed():
+                        pipeline.check_status(reply_type, msg)
+                        
+            pipeline.drain()
+            for _, reply_type, msg in pipeline.completed():
+                pipeline.check_status(reply_type, msg)
+    
+    def _open_worker(self) -> "SlateSFTP":
+        """
+        Open a worker client with its own SFTP channel on this connection's transport.
+        
+        The worker shares this client's transport, settings, metadata cache
+        and known directories. Closing it closes only its channel.
+        
+        Returns:
+            SlateSFTP
+        """
+        if not self.transport or not self.transport.is_active():
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        worker = copy.copy(self)
+        worker._owns_transport = False
+        worker.sftp = ProbingSFTPClient.from_transport(self.transport, **self.tuning.channel_options())
+        return worker
+    
+    def _connection_settings(self) -> dict:
+        """Keyword arguments for a SlateSFTP connecting like this one, e.g. in another process."""
+        return {
+            "hostname": self.hostname,
+            "port": self.port,
+            "username": self.username,
+            "private_key_path": self.private_key_path,
+            "tuning": self.tuning,
+            "keepalive": self.keepalive,
+            "reconnect_attempts": self.reconnect_attempts,
+            "reconnect_backoff": self.reconnect_backoff,
+        }
+    
+    def _manifest_host(self) -> str:
+        """The host part of this connection's manifest keys, e.g. 'sftp.example.edu:22'."""
+        return f"{self.hostname}:{self.port}"
+    
+    def _already_downloaded(self, remote_path: str, local_path: str, size: int, mtime: float) -> bool:
+        """
+        Check the manifest and the local copy for a download that can be skipped.
+        
+        Args:
+            remote_path: The path of the file on the remote server
+            local_path: Where the file would be downloaded to
+            size: The remote file's current size in bytes
+            mtime: The remote file's current modification time
+            
+        Returns:
+            bool: True if the manifest has the file as it is now and local_path
+            holds a file of the same size
+        """
+        if not self.manifest.is_current(self._manifest_host(), remote_path, size, mtime):
+            return False
+        try:
+            return os.path.getsize(local_path) == size
+        except OSError:
+            return False
+    
+    def _remember_download(self, result: TransferResult, attributes: Optional[Tuple[int, float]]):
+        """
+        Record a successful download in the manifest.
+        
+        Args:
+            result: The download's TransferResult
+            attributes: The (size, mtime) the remote file was listed with,
+                or None if it could not be listed
+        """
+        if not result.success or attributes is None:
+            return
+        self._record_transfer(result.source, result.destination, *attributes)
+    
+    def _remember_uploads(self, uploads: Iterable[Tuple[str, str]]):
+        """
+        Record successful uploads in the manifest, as the server now has them.
+        
+        The uploaded files are stat'ed in one pipelined batch, so their
+        remote size and mtime are recorded rather than the local ones.
+        
+        Args:
+            uploads: Pairs of (local_path, remote_path) that were uploaded
+        """
+        uploads = list(uploads)
+        try:
+            if self.cache:
+                for _, remote_path in uploads:
+                    self.cache.invalidate(remote_path)
+            remote_stats = self.stat_many([remote_path for _, remote_path in uploads])
+        except (IOError, EOFError) as e:
+            print(f"Failed to record {len(uploads)} uploads in the transfer manifest: {str(e)}")
+            return
+        for (local_path, remote_path), attributes in zip(uploads, remote_stats):
+            if attributes is not None:
+                self._record_transfer(remote_path, local_path, attributes.st_size or 0, attributes.st_mtime)
+    
+    def _record_transfer(self, remote_path: str, local_path: str, size: int, mtime: Optional[float]):
+        """
+        Record a transferred file in the manifest.
+        
+        Args:
+            remote_path: The path of the file on the remote server
+            local_path: The local copy, checksummed if the manifest keeps checksums
+            size: The remote file's size in bytes
+            mtime: The remote file's modification time; nothing is recorded
+                if the server did not report one
+        """
+        if mtime is None:
+            return
+        try:
+            checksum = file_checksum(local_path) if self.manifest.checksums else None
+            self.manifest.record(self._manifest_host(), remote_path, size, mtime, checksum)
+        except Exception as e:
+            print(f"Failed to record {remote_path} in the transfer manifest: {str(e)}")
+    
+    def _connection_lost(self) -> bool:
+        """True if this client was connected and its transport or SFTP channel has since died."""
+        if not self._owns_transport or not self.sftp or not self.transport:
+            return False
+        return not self.transport.is_active() or self.sftp.get_channel().closed
+    
+    def _reconnect(self) -> bool:
+        """
+        Replace a lost connection, backing off between attempts.
+        
+        Waits reconnect_backoff seconds before the first attempt and twice
+        as long before each further one, up to MAX_RECONNECT_DELAY.
+        
+        Returns:
+            bool: True once connected again, False if every attempt failed
+        """
+        for attempt in range(self.reconnect_attempts):
+            delay = min(self.reconnect_backoff * 2 ** attempt, MAX_RECONNECT_DELAY)
+            print(f"Connection to {self.hostname} lost, reconnecting in {delay:g}s "
+                  f"(attempt {attempt + 1} of {self.reconnect_attempts})")
+            time.sleep(delay)
+            self.close()
+            if self.connect():
+                return True
+        return False
+    
+    def _run_transfers(
+        self,
+        method: str,
+        jobs: Iterable[Tuple[str, str]],
+        max_workers: int,
+        local_side: int,
+        processes: int = 0,
+        progress: Optional[Callable[[TransferResult], None]] = None,
+        pool: Optional[ChannelPool] = None,
+        **options
+    ) -> TransferReport:
+        """
+        Run single-file transfers, optionally spread over a pool of channels.
+        
+        Jobs are pulled from the iterable through a bounded queue, so a
+        generator (e.g. one walking a tree) is consumed no faster than the
+        workers can transfer.
+        
+        Args:
+            method: Name of the single-file method, e.g. 'download_file'
+            jobs: Iterable of (source, destination) path pairs
+            max_workers: Number of transfers to run at once
+            local_side: Index (0 or 1) of the local path in each job, used to measure bytes
+            processes: Number of worker processes to run the transfers in
+                (default: 0, run them in this process)
+            progress: Called with each TransferResult as it finishes; from a
+                worker thread when max_workers > 1
+            pool: Channels to transfer on, which other work may share
+                (default: open max_workers channels for the run)
+            **options: Extra keyword arguments passed to every call of method
+            
+        Returns:
+            TransferReport with results in the same order as jobs
+        """
+        start = time.monotonic()
+        if self.reconnect_attempts and self._connection_lost():
+            # Dropped while idle: restore it before opening worker channels
+            self._reconnect()
+        report = self._run_jobs(method, jobs, max_workers, local_side, processes, progress, pool, **options)
+        
+        # Replay the failed transfers if they failed because the connection was lost
+        failed = [index for index, result in enumerate(report.results) if not result.success]
+        replays = 0
+        while failed and replays < self.reconnect_attempts and self._connection_lost() and self._reconnect():
+            replays += 1
+            retry = self._run_jobs(
+                method,
+                [(report.results[index].source, report.results[index].destination) for index in failed],
+                max_workers, local_side, processes, progress, **options
+            )
+            for index, result in zip(failed, retry.results):
+                report.results[index] = result
+                report[index] = (result.name, result.success)
+            failed = [index for index, result in zip(failed, retry.results) if not result.success]
+            
+        report.elapsed = time.monotonic() - start
+        return report
+    
+    def _run_jobs(
+        self,
+        method: str,
+        jobs: Iterable[Tuple[str, str]],
+        max_workers: int,
+        local_side: int,
+        processes: int,
+        progress: Optional[Callable[[TransferResult], None]],
+        pool: Optional[ChannelPool] = None,
+        **options
+    ) -> TransferReport:
+        """
+        Run single-file transfers once, serially or over a pool of channels.
+        
+        Takes the same arguments as _run_transfers, which adds timing and
+        replays after a lost connection.
+        
+        Returns:
+            TransferReport with results in the same order as jobs
+        """
+        if processes:
+            report = run_in_processes(
+                self._connection_settings(), method, jobs, processes, local_side, progress, **options
+            )
+            if self.cache and local_side == 0:
+                # The worker processes' writes bypassed this client's cache
+                for result in report.results:
+                    self.cache.invalidate(result.destination)
+            return report
+            
+        report = TransferReport()
+        workers = min(max_workers, len(jobs)) if isinstance(jobs, list) else max_workers
+        
+        if workers <= 1:
+            transfer = partial(getattr(self, method), **options)
+            for job in jobs:
+                result = timed_transfer(transfer, job[0], job[1], job[local_side])
+                report.add(result)
+                notify_progress(progress, result)
+        else:
+            pending = queue.Queue(maxsize=workers * 2)
+            results = []
+            
+            own_pool = pool is None or pool.transport is not self.transport
+            if own_pool:
+                # None given, or it belongs to a connection lost since
+                pool = ChannelPool(self, workers)
+            try:
+                def consume():
+                    while True:
+                        item = pending.get()
+                        if item is None:
+                            return
+                        index, job = item
+                        # Leased per file, so a shared pool stays available to other work
+                        with pool.lease() as worker:
+                            transfer = partial(getattr(worker, method), **options)
+                            result = timed_transfer(transfer, job[0], job[1], job[local_side])
+                        results.append((index, result))
+                        notify_progress(progress, result)
+                        
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    consumers = [executor.submit(consume) for _ in range(workers)]
+                    
+                    def submit(item) -> bool:
+                        # Waits for room in the queue while any consumer is running
+                        while True:
+                            try:
+                                pending.put(item, timeout=1.0)
+                                return True
+                            except queue.Full:
+                                if all(consumer.done() for consumer in consumers):
+                                    return False
+                                    
+                    try:
+                        for item in enumerate(jobs):
+                            if not submit(item):
+                                raise RuntimeError("All transfer threads exited")
+                    finally:
+                        for _ in consumers:
+                            if not submit(None):
+                                break
+            finally:
+                if own_pool:
+                    pool.close()
+                    
+            for _, result in sorted(results, key=lambda item: item[0]):
+                report.add(result)
+                
+        return report
+    
+    def cache_stats(self) -> Optional[dict]:
+        """
+        Report metadata cache hit/miss counters.
+        
+        Returns:
+            Dict with hits, misses, evictions and entries, or None if caching is disabled
+        """
+        return self.cache.stats() if self.cache else None
+    
+    def _pipelined(self, requests: Iterable[Tuple[int, tuple]], window: int) -> List[Tuple[int, Message]]:
+        """
+        Send SFTP requests through a RequestPipeline and collect every reply.
+        
+        Args:
+            requests: Iterable of (request type, request fields) tuples
+            window: Maximum requests awaiting a reply
+            
+        Returns:
+            List of (reply type, message) tuples, in the same order as requests
+        """
+        pipeline = RequestPipeline(self.sftp, window)
+        order = {}
+        for index, (request_type, args) in enumerate(requests):
+            order[pipeline.submit(request_type, *args)] = index
+        pipeline.drain()
+        
+        replies = [None] * len(order)
+        for num, reply_type, msg in pipeline.completed():
+            replies[order[num]] = (reply_type, msg)
+        return replies
+    
+    def _reply_ok(self, reply: Tuple[int, Message], failure: str) -> bool:
+        """Return True if a pipelined reply is a success status, else print failure with the error."""
+        reply_type, msg = reply
+        try:
+            if reply_type == CMD_STATUS:
+                # Raises unless the status is SFTP_OK
+                self.sftp._convert_status(msg)
+            return True
+        except (IOError, EOFError) as e:
+            print(f"{failure}: {str(e)}")
             return False
     
+    def _stat(self, remote_path: str) -> paramiko.SFTPAttributes:
+        """
+        Stat a remote path, answering from the metadata cache when enabled.
+        
+        Args:
+            remote_path: The remote path to stat
+            
+        Returns:
+            paramiko.SFTPAttributes
+            
+        Raises:
+            IOError: If the path does not exist
+        """
+        if self.cache:
+            attributes = self.cache.get_stat(remote_path)
+            if attributes is not None:
+                return attributes
+                
+        attributes = self.sftp.stat(remote_path)
+        if self.cache:
+            self.cache.put_stat(remote_path, attributes)
+        return attributes
+    
+    def _iter_attributes(self, remote_path: str, read_aheads: int) -> Iterator[Tuple[str, paramiko.SFTPAttributes]]:
+        """
+        Yield (name, attributes) for each entry of a remote directory.
+        
+        Symbolic links are resolved with a stat so they report their
+        target's type; dangling links are skipped. The stats are only sent
+        once the listing has finished, since paramiko drops the replies to
+        READDIR requests still in flight when another request is made on the
+        channel, so links come after all other entries.
+        
+        Args:
+            remote_path: The remote path to list
+            read_aheads: Number of READDIR requests kept in flight
+        """
+        if not self.sftp:
+            raise ConnectionError("Not connected to SFTP server. Call connect() first.")
+            
+        links = []
+        for attr in self.sftp.listdir_iter(remote_path, read_aheads=read_aheads):
+            if stat.S_ISLNK(attr.st_mode or 0):
+                links.append(attr.filename)
+            else:
+                yield attr.filename, attr
+                
+        if links:
+            targets = self.stat_many([os.path.join(remote_path, name) for name in links])
+            for name, attr in zip(links, targets):
+                if attr is not None:
+                    yield name, attr
+    
     def _mkdir_p(self, remote_dir: str):
         """
         Create a remote directory and all its parent directories if they don't exist.
@@ -390,13 +1965,42 @@ class SlateSFTP:
         Args:
             remote_dir: The path of the directory to create on the remote server
         """
-        if remote_dir == '/':
+        # Walk up until a directory is known or found to exist...
+        missing = []
+        path = normalize_remote_dir(remote_dir)
+        while path and path not in ('/', '.') and path not in self._known_dirs:
+            try:
+                self._stat(path)
+                self._known_dirs.add(path)
+                break
+            except IOError:
+                missing.append(path)
+                path = os.path.dirname(path)
+                
+        # ...then create the missing ones top-down
+        for path in reversed(missing):
+            self.sftp.mkdir(path)
+            if self.cache:
+                self.cache.invalidate(path)
+            self._known_dirs.add(path)
+    
+    def _ensure_remote_dir(self, remote_dir: str):
+        """
+        Make sure a remote directory exists, creating it and its parents if needed.
+        
+        Directories seen to exist during this session are remembered, so
+        repeated uploads into the same directory cost no extra round trips.
+        
+        Args:
+            remote_dir: The remote directory that must exist
+        """
+        path = normalize_remote_dir(remote_dir)
+        if not path or path in ('/', '.') or path in self._known_dirs:
             return
             
         try:
-            self.sftp.stat(remote_dir)
+            self._stat(path)
+            self._known_dirs.add(path)
         except IOError:
-            parent = os.path.dirname(remote_dir)
-            if parent:
-                self._mkdir_p(parent)
-            self.sftp.mkdir(remote_dir)
\ No newline at end of file
+            # Directory doesn't exist, create it
+            self._mkdir_p(path)
\ No newline at end of file
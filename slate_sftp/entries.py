@@ -0,0 +1,233 @@
+"""
+Typed directory entries built from the attributes returned by SFTP READDIR.
+
+RemoteEntry is a compact per-entry record; EntryListing stores a whole
+listing column-wise for very large directories.
+"""
+
+import re
+import stat
+from array import array
+from datetime import datetime
+from itertools import compress
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+# Bounds of the int64 size and mtime columns, used for conditions not given
+# (int-to-int comparisons are cheaper than comparisons with float("inf"))
+_INT64_MIN = -(2 ** 63)
+_INT64_END = 2 ** 63
+
+
+class RemoteEntry:
+    """
+    A single entry of a remote directory listing.
+
+    Attributes:
+        name: The entry name (no directory component)
+        size: Size in bytes
+        mtime: Modification time as a Unix timestamp
+        mode: The st_mode bits reported by the server
+    """
+
+    __slots__ = ("name", "size", "mtime", "mode")
+
+    def __init__(self, name: str, size: int = 0, mtime: int = 0, mode: int = 0):
+        self.name = name
+        self.size = size
+        self.mtime = mtime
+        self.mode = mode
+
+    @classmethod
+    def from_attributes(cls, attr, name: str = None) -> "RemoteEntry":
+        """
+        Build an entry from a paramiko SFTPAttributes object.
+
+        Args:
+            attr: The SFTPAttributes returned by listdir_attr/listdir_iter/stat
+            name: Entry name to use instead of attr.filename
+
+        Returns:
+            RemoteEntry
+        """
+        return cls(
+            name if name is not None else attr.filename,
+            attr.st_size or 0,
+            attr.st_mtime or 0,
+            attr.st_mode or 0,
+        )
+
+    @property
+    def is_dir(self) -> bool:
+        """True if the entry is a directory."""
+        return stat.S_ISDIR(self.mode)
+
+    @property
+    def is_file(self) -> bool:
+        """True if the entry is anything other than a directory."""
+        return not stat.S_ISDIR(self.mode)
+
+    @property
+    def is_link(self) -> bool:
+        """True if the server reported the entry as a symbolic link."""
+        return stat.S_ISLNK(self.mode)
+
+    def __eq__(self, other):
+        if not isinstance(other, RemoteEntry):
+            return NotImplemented
+        return (self.name, self.size, self.mtime, self.mode) == (
+            other.name, other.size, other.mtime, other.mode
+        )
+
+    def __repr__(self):
+        return "RemoteEntry(name={!r}, size={}, mtime={}, mode={:o})".format(
+            self.name, self.size, self.mtime, self.mode
+        )
+
+
+class EntryListing:
+    """
+    A columnar directory listing: entry names plus parallel arrays of sizes,
+    mtimes and modes.
+
+    Storing the numeric fields in typed arrays keeps a listing of a million
+    entries to a few tens of megabytes, and filters test every condition in
+    a single pass over the columns without creating a RemoteEntry per row.
+    Each array value read is boxed into a Python int, so a filter costs more
+    CPU than one over a list of RemoteEntry; the listing trades that for
+    memory (see benchmarks/listing_memory.py). Individual rows are
+    materialized only when indexed or iterated.
+    """
+
+    __slots__ = ("names", "sizes", "mtimes", "modes")
+
+    def __init__(self, names=None, sizes=None, mtimes=None, modes=None):
+        self.names = list(names) if names is not None else []
+        self.sizes = array("q", sizes if sizes is not None else ())
+        self.mtimes = array("q", mtimes if mtimes is not None else ())
+        self.modes = array("L", modes if modes is not None else ())
+        if not len(self.names) == len(self.sizes) == len(self.mtimes) == len(self.modes):
+            raise ValueError("Listing columns must all have the same length")
+
+    @classmethod
+    def from_entries(cls, entries: Iterable) -> "EntryListing":
+        """
+        Build a listing from RemoteEntry or SFTPAttributes objects.
+
+        Args:
+            entries: Iterable of RemoteEntry or SFTPAttributes
+
+        Returns:
+            EntryListing
+        """
+        listing = cls()
+        for entry in entries:
+            if isinstance(entry, RemoteEntry):
+                listing.append(entry.name, entry.size, entry.mtime, entry.mode)
+            else:
+                listing.append(entry.filename, entry.st_size, entry.st_mtime, entry.st_mode)
+        return listing
+
+    def append(self, name: str, size: int, mtime: int, mode: int):
+        """Append one row to the listing."""
+        self.names.append(name)
+        self.sizes.append(size or 0)
+        self.mtimes.append(int(mtime or 0))
+        self.modes.append(mode or 0)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> RemoteEntry:
+        return RemoteEntry(self.names[index], self.sizes[index], self.mtimes[index], self.modes[index])
+
+    def __iter__(self) -> Iterator[RemoteEntry]:
+        for row in zip(self.names, self.sizes, self.mtimes, self.modes):
+            yield RemoteEntry(*row)
+
+    def __repr__(self):
+        return "EntryListing({} entries)".format(len(self))
+
+    def mask(
+        self,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        since: Union[int, float, datetime, None] = None,
+        until: Union[int, float, datetime, None] = None,
+        kind: Optional[str] = None,
+        pattern: Optional[str] = None,
+    ) -> List[bool]:
+        """
+        Compute a boolean mask of the rows matching every given condition.
+
+        Args:
+            min_size: Keep rows whose size is strictly greater than this
+            max_size: Keep rows whose size is at most this
+            since: Keep rows modified at or after this time (timestamp or datetime)
+            until: Keep rows modified before this time (timestamp or datetime)
+            kind: 'file' or 'dir' to keep only that type of entry
+            pattern: Regex that must match the entry name (re.search)
+
+        Returns:
+            List of booleans, one per row
+        """
+        # Every condition becomes a bound, so one chained comparison per
+        # row tests all of them in a single pass
+        low_size = min_size if min_size is not None else _INT64_MIN
+        high_size = max_size if max_size is not None else _INT64_END
+        start = _as_timestamp(since) if since is not None else _INT64_MIN
+        end = _as_timestamp(until) if until is not None else _INT64_END
+        if kind is None and pattern is None:
+            return [
+                low_size < size <= high_size and start <= mtime < end
+                for size, mtime in zip(self.sizes, self.mtimes)
+            ]
+
+        if kind not in (None, "file", "dir"):
+            raise ValueError("kind must be 'file' or 'dir'")
+        want_dir = kind == "dir"
+        search = re.compile(pattern).search if pattern is not None else None
+        return [
+            low_size < size <= high_size and start <= mtime < end
+            and (kind is None or stat.S_ISDIR(mode) == want_dir)
+            and (search is None or search(name) is not None)
+            for name, size, mtime, mode in zip(self.names, self.sizes, self.mtimes, self.modes)
+        ]
+
+    def select(self, mask: Sequence[bool]) -> "EntryListing":
+        """
+        Return a new listing holding only the rows where mask is true.
+
+        Args:
+            mask: One boolean per row, e.g. from mask()
+
+        Returns:
+            EntryListing
+        """
+        listing = EntryListing()
+        listing.names = list(compress(self.names, mask))
+        listing.sizes = array("q", compress(self.sizes, mask))
+        listing.mtimes = array("q", compress(self.mtimes, mask))
+        listing.modes = array("L", compress(self.modes, mask))
+        return listing
+
+    def where(self, **conditions) -> "EntryListing":
+        """
+        Filter the listing, e.g. listing.where(min_size=1024, since=yesterday).
+
+        Accepts the same keyword arguments as mask().
+
+        Returns:
+            EntryListing
+        """
+        return self.select(self.mask(**conditions))
+
+    def total_size(self) -> int:
+        """Sum of the sizes of all rows."""
+        return sum(self.sizes)
+
+
+def _as_timestamp(value) -> float:
+    """Convert a datetime or number to a Unix timestamp."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
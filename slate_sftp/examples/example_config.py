@@ -35,9 +35,11 @@ Setup Instructions:
     1. Update SLATE_SFTP_HOST with your institution's Slate SFTP hostname
     2. Verify or change SLATE_SFTP_PORT if your server uses a non-standard port
     3. Set SLATE_SFTP_USERNAME to your service account username
-    4. Update SLATE_PRIVATE_KEY_PATH to the location of your RSA private key file
+    4. Update SLATE_PRIVATE_KEY_PATH to the location of your private key file (Ed25519, ECDSA or RSA)
     5. Adjust the DEFAULT_REMOTE_DIR to your most commonly used directory
     6. Set LOCAL_DOWNLOAD_DIR to your preferred local directory for downloaded files
+    7. Optionally adjust SLATE_KEEPALIVE_INTERVAL and SLATE_RECONNECT_ATTEMPTS
+    8. Optionally set SLATE_MANIFEST_PATH so scheduled downloads skip files fetched before
 
 Security Note:
     This file contains sensitive connection information. Ensure it is:
@@ -62,5 +64,12 @@ SLATE_OUTGOING_DIR = "/outgoing/"   # Common outgoing directory
 # Local paths for downloaded files
 LOCAL_DOWNLOAD_DIR = r"C:\Downloads\slate_data"
 
+# Connection resilience for long-running jobs
+SLATE_KEEPALIVE_INTERVAL = 30  # Seconds between SSH keepalives (0 to disable)
+SLATE_RECONNECT_ATTEMPTS = 3  # Reconnection attempts after a dropped connection
+
+# Local record of downloaded files (None to disable)
+SLATE_MANIFEST_PATH = r"C:\Downloads\slate_data\transfers.sqlite"
+
 # Toggle for verbose logging
 DEBUG = True
\ No newline at end of file
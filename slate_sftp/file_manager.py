@@ -30,7 +30,7 @@ import re
 
 # Import the SlateSFTP class and configuration
 try:
-    from slate_sftp import SlateSFTP
+    from slate_sftp import SlateSFTP, TransferManifest
     import config
 except ImportError as e:
     print(f"Error importing required modules: {e}")
@@ -39,11 +39,16 @@ except ImportError as e:
 
 def connect_to_sftp():
     """Establish connection to SFTP server and return client instance."""
+    manifest_path = getattr(config, "SLATE_MANIFEST_PATH", None)
     sftp_client = SlateSFTP(
         hostname=config.SLATE_SFTP_HOST,
         port=config.SLATE_SFTP_PORT,
         username=config.SLATE_SFTP_USERNAME,
-        private_key_path=config.SLATE_PRIVATE_KEY_PATH
+        private_key_path=config.SLATE_PRIVATE_KEY_PATH,
+        # Older config files do not define these
+        keepalive=getattr(config, "SLATE_KEEPALIVE_INTERVAL", 0),
+        reconnect_attempts=getattr(config, "SLATE_RECONNECT_ATTEMPTS", 3),
+        manifest=TransferManifest(manifest_path) if manifest_path else None
     )
     
     if not sftp_client.connect():
@@ -54,34 +59,31 @@ def connect_to_sftp():
     return sftp_client
 
 def list_files(sftp_client, remote_dir):
-    """List all files in the specified directory."""
+    """List all files in the specified directory, printing them as they arrive."""
     try:
         print(f"\nListing files in {remote_dir}:")
-        files = sftp_client.list_files(remote_dir)
-        
-        if not files:
-            print("No files found in the specified directory.")
-            return []
         
-        # Format and display the file list with sizes
-        print(f"{'Filename':<60} {'Size (KB)':<12} {'Updated':<20}")
-        print("-" * 92)
-        
-        # Get file details for each file
+        # Get file details for each file straight from the listing
         file_details = []
-        for filename in files:
-            try:
-                remote_path = os.path.join(remote_dir, filename)
-                file_stat = sftp_client.sftp.stat(remote_path)
-                size_kb = file_stat.st_size / 1024
-                # Format modification time
-                mod_time = datetime.fromtimestamp(file_stat.st_mtime)
-                mod_time_str = mod_time.strftime("%m/%d/%Y %H:%M:%S")
-                
-                print(f"{filename:<60} {size_kb:,.2f} KB    {mod_time_str}")
-                file_details.append((filename, size_kb, mod_time))
-            except Exception as e:
-                print(f"{filename:<60} Error retrieving file details: {str(e)}")
+        for entry in sftp_client.iter_entries(remote_dir):
+            if entry.is_dir:
+                continue
+            
+            if not file_details:
+                # Format and display the file list with sizes
+                print(f"{'Filename':<60} {'Size (KB)':<12} {'Updated':<20}")
+                print("-" * 92)
+            
+            size_kb = entry.size / 1024
+            # Format modification time
+            mod_time = datetime.fromtimestamp(entry.mtime)
+            mod_time_str = mod_time.strftime("%m/%d/%Y %H:%M:%S")
+            
+            print(f"{entry.name:<60} {size_kb:,.2f} KB    {mod_time_str}", flush=True)
+            file_details.append((entry.name, size_kb, mod_time))
+        
+        if not file_details:
+            print("No files found in the specified directory.")
         
         return file_details
     
@@ -89,7 +91,7 @@ def list_files(sftp_client, remote_dir):
         print(f"Error listing files: {str(e)}")
         return []
 
-def download_files(sftp_client, remote_dir, pattern=None, download_dir=None):
+def download_files(sftp_client, remote_dir, pattern=None, download_dir=None, workers=1, resume=False, then_archive=None):
     """
     Download files matching the specified pattern from the remote directory.
     
@@ -98,6 +100,9 @@ def download_files(sftp_client, remote_dir, pattern=None, download_dir=None):
         remote_dir: Remote directory to download from
         pattern: Regex pattern to match filenames (default: download all files)
         download_dir: Local directory to save files (default: config.LOCAL_DOWNLOAD_DIR)
+        workers: Number of files to download at once (default: 1)
+        resume: Continue interrupted downloads instead of starting over (default: False)
+        then_archive: Remote directory to move the downloaded files into (default: leave them)
     """
     if download_dir is None:
         download_dir = config.LOCAL_DOWNLOAD_DIR
@@ -127,26 +132,53 @@ def download_files(sftp_client, remote_dir, pattern=None, download_dir=None):
             print("No files match the specified pattern.")
             return
         
-        # Download each file
-        successful = 0
-        for filename in files_to_download:
-            remote_path = os.path.join(remote_dir, filename)
-            local_path = os.path.join(download_dir, filename)
-            
-            print(f"Downloading {filename}... ", end="", flush=True)
-            if sftp_client.download_file(remote_path, local_path):
-                print("SUCCESS")
-                successful += 1
-            else:
-                print("FAILED")
+        if workers > 1 or sftp_client.manifest:
+            # Download several files at once (skipping those in the manifest)
+            # and report when they are all done
+            print(f"Downloading with {workers} parallel transfers...")
+            remote_paths = [os.path.join(remote_dir, filename) for filename in files_to_download]
+            report = sftp_client.download_files(remote_paths, download_dir, max_workers=workers, resume=resume)
+            for remote_path in report.skipped:
+                print(f"Downloading {os.path.basename(remote_path)}... SKIPPED (already downloaded)")
+            for result in report.results:
+                status = "SUCCESS" if result.success else "FAILED"
+                print(f"Downloading {result.name}... {status}")
+            successful = report.succeeded
+            skipped = len(report.skipped)
+            # Files skipped as already downloaded are archived too
+            downloaded = report.skipped + [result.source for result in report.results if result.success]
+            print(f"\nTransferred {report.summary()}")
+        else:
+            # Download each file
+            successful = 0
+            skipped = 0
+            downloaded = []
+            for filename in files_to_download:
+                remote_path = os.path.join(remote_dir, filename)
+                local_path = os.path.join(download_dir, filename)
+                
+                print(f"Downloading {filename}... ", end="", flush=True)
+                if sftp_client.download_file(remote_path, local_path, resume=resume):
+                    print("SUCCESS")
+                    successful += 1
+                    downloaded.append(remote_path)
+                else:
+                    print("FAILED")
         
-        print(f"\nDownload complete: {successful} of {len(files_to_download)} files downloaded successfully")
+        print(f"\nDownload complete: {successful} of {len(files_to_download) - skipped} files downloaded successfully")
+        if skipped:
+            print(f"Skipped {skipped} files already downloaded (see the transfer manifest)")
         print(f"Files saved to: {download_dir}")
+        
+        if then_archive and downloaded:
+            # Move only the files that are downloaded
+            archived = sum(1 for _, success in sftp_client.archive(downloaded, then_archive) if success)
+            print(f"Archived {archived} of {len(downloaded)} files to {then_archive}")
     
     except Exception as e:
         print(f"Error downloading files: {str(e)}")
 
-def upload_file(sftp_client, file_path, remote_dir):
+def upload_file(sftp_client, file_path, remote_dir, resume=False):
     """
     Upload a file to the specified remote directory.
     
@@ -154,6 +186,7 @@ def upload_file(sftp_client, file_path, remote_dir):
         sftp_client: SlateSFTP instance
         file_path: Path to the local file to upload
         remote_dir: Remote directory to upload to
+        resume: Continue an interrupted upload instead of starting over (default: False)
     """
     if not os.path.exists(file_path):
         print(f"Error: File not found - {file_path}")
@@ -164,7 +197,7 @@ def upload_file(sftp_client, file_path, remote_dir):
         remote_path = os.path.join(remote_dir, filename)
         
         print(f"Uploading {filename} to {remote_dir}... ", end="", flush=True)
-        if sftp_client.upload_file(file_path, remote_path):
+        if sftp_client.upload_file(file_path, remote_path, resume=resume):
             print("SUCCESS")
             return True
         else:
@@ -175,6 +208,32 @@ def upload_file(sftp_client, file_path, remote_dir):
         print(f"Error uploading file: {str(e)}")
         return False
 
+def upload_files(sftp_client, file_paths, remote_dir, workers=1, resume=False):
+    """
+    Upload several files to the specified remote directory.
+    
+    Args:
+        sftp_client: SlateSFTP instance
+        file_paths: Paths to the local files to upload
+        remote_dir: Remote directory to upload to
+        workers: Number of files to upload at once (default: 1)
+        resume: Continue interrupted uploads instead of starting over (default: False)
+    """
+    try:
+        print(f"Uploading {len(file_paths)} files to {remote_dir} with {workers} parallel transfers...")
+        report = sftp_client.upload_files(file_paths, remote_dir, max_workers=workers, resume=resume)
+        
+        for result in report.results:
+            status = "SUCCESS" if result.success else "FAILED"
+            print(f"Uploading {result.name}... {status}")
+        
+        print(f"\nUpload complete: {report.summary()}")
+        return report.failed == 0
+    
+    except Exception as e:
+        print(f"Error uploading files: {str(e)}")
+        return False
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Manage files on Slate SFTP server")
@@ -191,10 +250,15 @@ def parse_arguments():
     download_parser.add_argument("--dir", help=f"Remote directory path (default: {config.DEFAULT_REMOTE_DIR})")
     download_parser.add_argument("--pattern", help="Pattern to match filenames (e.g., '2024ModelProspApps')")
     download_parser.add_argument("--local-dir", help=f"Directory to save downloaded files (default: {config.LOCAL_DOWNLOAD_DIR})")
+    download_parser.add_argument("--workers", type=int, default=1, help="Number of files to download at once (default: 1)")
+    download_parser.add_argument("--resume", action="store_true", help="Continue interrupted downloads instead of starting over")
+    download_parser.add_argument("--then-archive", metavar="DIR", help="Remote directory to move files into after downloading them")
     
     # Upload command
-    upload_parser = subparsers.add_parser("upload", help="Upload a file")
-    upload_parser.add_argument("--file", required=True, help="Path to the file to upload")
+    upload_parser = subparsers.add_parser("upload", help="Upload one or more files")
+    upload_parser.add_argument("--file", required=True, nargs="+", help="Path to the file(s) to upload")
+    upload_parser.add_argument("--workers", type=int, default=1, help="Number of files to upload at once (default: 1)")
+    upload_parser.add_argument("--resume", action="store_true", help="Continue interrupted uploads instead of starting over")
     upload_parser.add_argument("--dir", help=f"Remote directory path (default: {config.DEFAULT_REMOTE_DIR})")
     
     return parser.parse_args()
@@ -219,14 +283,21 @@ def main():
             
         elif args.command == "download":
             download_dir = args.local_dir if hasattr(args, 'local_dir') and args.local_dir else config.LOCAL_DOWNLOAD_DIR
-            download_files(sftp_client, remote_dir, args.pattern, download_dir)
+            download_files(
+                sftp_client, remote_dir, args.pattern, download_dir, args.workers, args.resume, args.then_archive
+            )
             
         elif args.command == "upload":
-            upload_file(sftp_client, args.file, remote_dir)
+            if len(args.file) == 1:
+                upload_file(sftp_client, args.file[0], remote_dir, args.resume)
+            else:
+                upload_files(sftp_client, args.file, remote_dir, args.workers, args.resume)
     
     finally:
         # Always close the connection
         sftp_client.close()
+        if sftp_client.manifest:
+            sftp_client.manifest.close()
         print("\nConnection closed.")
 
 if __name__ == "__main__":
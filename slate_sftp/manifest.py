@@ -0,0 +1,192 @@
+"""
+A persistent local record of the files SlateSFTP has transferred.
+
+The manifest is a SQLite database keyed by (host, remote_path), so a
+scheduled job can tell which remote files it already fetched on an earlier
+run, or that another process fetched, without transferring them again.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transfers (
+    host TEXT NOT NULL,
+    remote_path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    checksum TEXT,
+    transferred_at REAL NOT NULL,
+    PRIMARY KEY (host, remote_path)
+) WITHOUT ROWID
+"""
+
+
+class ManifestRecord:
+    """
+    What the manifest remembers about one transferred file.
+
+    Attributes:
+        size: Size of the remote file in bytes when it was transferred
+        mtime: Modification time of the remote file as a Unix timestamp
+        checksum: SHA-256 hex digest of the transferred file, or None if not computed
+        transferred_at: When the transfer finished, as a Unix timestamp
+    """
+
+    __slots__ = ("size", "mtime", "checksum", "transferred_at")
+
+    def __init__(self, size: int, mtime: int, checksum: Optional[str] = None, transferred_at: float = 0.0):
+        self.size = size
+        self.mtime = mtime
+        self.checksum = checksum
+        self.transferred_at = transferred_at
+
+    def __repr__(self):
+        return "ManifestRecord(size={}, mtime={}, checksum={!r})".format(self.size, self.mtime, self.checksum)
+
+
+class TransferManifest:
+    """
+    A thread-safe SQLite manifest of transferred files.
+
+    Lookups are point queries on the (host, remote_path) primary key.
+    Records are buffered and written batch_size at a time in a single
+    transaction, and lookups see buffered records too. The database uses
+    write-ahead logging, so several processes can share one manifest file.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, checksums: bool = False, timeout: float = 30.0):
+        """
+        Open (or create) a manifest.
+
+        Args:
+            path: Path of the SQLite database file
+            batch_size: Records buffered before they are written (default: 500)
+            checksums: Whether transfers record a SHA-256 of each local file
+                (default: False, it costs a full read of every file)
+            timeout: Seconds to wait for another process's write to finish (default: 30)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.path = path
+        self.batch_size = batch_size
+        self.checksums = checksums
+        self._pending = {}
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def lookup(self, host: str, remote_path: str) -> Optional[ManifestRecord]:
+        """
+        Return what the manifest knows about a remote file.
+
+        Args:
+            host: The server the file is on, e.g. 'sftp.example.edu:22'
+            remote_path: The path of the file on that server
+
+        Returns:
+            ManifestRecord, or None if the file was never recorded
+        """
+        key = (host, os.path.normpath(remote_path))
+        with self._lock:
+            row = self._pending.get(key)
+            if row is None:
+                row = self._connection.execute(
+                    "SELECT size, mtime, checksum, transferred_at FROM transfers WHERE host = ? AND remote_path = ?",
+                    key,
+                ).fetchone()
+        return ManifestRecord(*row) if row is not None else None
+
+    def is_current(self, host: str, remote_path: str, size: int, mtime: float) -> bool:
+        """
+        Check whether a remote file was already transferred as it is now.
+
+        Args:
+            host: The server the file is on
+            remote_path: The path of the file on that server
+            size: The file's current size in bytes
+            mtime: The file's current modification time as a Unix timestamp
+
+        Returns:
+            bool: True if the manifest has the file with the same size and mtime
+        """
+        record = self.lookup(host, remote_path)
+        return record is not None and record.size == size and record.mtime == int(mtime)
+
+    def record(
+        self, host: str, remote_path: str, size: int, mtime: float, checksum: Optional[str] = None
+    ):
+        """
+        Remember that a remote file was transferred.
+
+        The record is buffered and written with the next batch.
+
+        Args:
+            host: The server the file is on
+            remote_path: The path of the file on that server
+            size: The file's size in bytes
+            mtime: The file's modification time as a Unix timestamp
+            checksum: SHA-256 hex digest of the file, if known
+        """
+        key = (host, os.path.normpath(remote_path))
+        with self._lock:
+            self._pending[key] = (int(size), int(mtime), checksum, time.time())
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def flush(self):
+        """Write all buffered records."""
+        with self._lock:
+            self._write_pending()
+
+    def close(self):
+        """Write all buffered records and close the database."""
+        with self._lock:
+            if self._connection is None:
+                return
+            self._write_pending()
+            self._connection.close()
+            self._connection = None
+
+    def count(self) -> int:
+        """Number of files recorded."""
+        self.flush()
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM transfers").fetchone()[0]
+
+    def __enter__(self):
+        """Support for the context manager protocol."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Support for the context manager protocol."""
+        self.close()
+
+    def _write_pending(self):
+        """Write the buffered records in one transaction. Callers hold the lock."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO transfers VALUES (?, ?, ?, ?, ?, ?)",
+                [key + row for key, row in pending.items()],
+            )
+
+
+def file_checksum(local_path: str, block_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a local file."""
+    digest = hashlib.sha256()
+    with open(local_path, "rb") as local_file:
+        for block in iter(lambda: local_file.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,110 @@
+"""
+Pipelined SFTP requests: many requests in flight on one channel.
+
+paramiko's SFTPClient methods send one request and wait for its reply.
+RequestPipeline uses the same request/response machinery paramiko's own
+prefetching uses, keeping up to a window of requests outstanding and
+collecting the replies as they arrive.
+"""
+
+from typing import Iterator, Tuple
+
+from paramiko.message import Message
+from paramiko.sftp import CMD_STATUS
+
+
+class RequestPipeline:
+    """
+    Keeps up to window SFTP requests outstanding on one channel.
+
+    Use one pipeline per channel from a single thread. Replies are stored
+    until they are collected with reply() or completed().
+    """
+
+    def __init__(self, sftp, window: int = 64):
+        """
+        Initialize the pipeline.
+
+        Args:
+            sftp: The paramiko SFTPClient (channel) to send requests on
+            window: Maximum number of requests awaiting a reply (default: 64)
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.sftp = sftp
+        self.window = window
+        self._pending = set()
+        self._replies = {}
+
+    def submit(self, request_type: int, *args) -> int:
+        """
+        Send a request, first waiting for replies if the window is full.
+
+        Args:
+            request_type: The SFTP request type, e.g. paramiko.sftp.CMD_STAT
+            *args: The request fields, packed as paramiko packs them
+
+        Returns:
+            int: The request number, used to collect the reply
+        """
+        while len(self._pending) >= self.window:
+            self._receive()
+        num = self.sftp._async_request(self, request_type, *args)
+        self._pending.add(num)
+        return num
+
+    def reply(self, num: int) -> Tuple[int, Message]:
+        """
+        Wait for and return the reply to one request.
+
+        Args:
+            num: A request number returned by submit()
+
+        Returns:
+            Tuple of (reply type, message)
+        """
+        while num not in self._replies:
+            if num not in self._pending:
+                raise KeyError(f"No request {num} is pending on this pipeline")
+            self._receive()
+        return self._replies.pop(num)
+
+    def completed(self) -> Iterator[Tuple[int, int, Message]]:
+        """
+        Yield (request number, reply type, message) for every reply received so far.
+
+        Collected replies are removed from the pipeline.
+        """
+        while self._replies:
+            num, (request_type, msg) = self._replies.popitem()
+            yield num, request_type, msg
+
+    def drain(self):
+        """Wait until every outstanding request has been answered."""
+        while self._pending:
+            self._receive()
+
+    def check_status(self, reply_type: int, msg: Message):
+        """
+        Raise the matching IOError/EOFError if a reply is an error status.
+
+        Args:
+            reply_type: The reply type from reply() or completed()
+            msg: The reply message
+        """
+        if reply_type == CMD_STATUS:
+            self.sftp._convert_status(msg)
+
+    @property
+    def outstanding(self) -> int:
+        """Number of requests still awaiting a reply."""
+        return len(self._pending)
+
+    def _receive(self):
+        # Reads one reply; paramiko hands it to _async_response below
+        self.sftp._read_response()
+
+    def _async_response(self, reply_type: int, msg: Message, num: int):
+        """Called by paramiko's SFTPClient when a reply to one of our requests arrives."""
+        self._pending.discard(num)
+        self._replies[num] = (reply_type, msg)
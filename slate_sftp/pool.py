@@ -0,0 +1,382 @@
+"""
+Pools of SFTP channels for running transfers concurrently, and of
+authenticated connections shared between jobs.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class ChannelPool:
+    """
+    A fixed set of SFTP channels opened on one authenticated transport.
+
+    Each channel is wrapped in a worker SlateSFTP that shares the parent's
+    transport, settings and caches but has its own SFTP session, so
+    several threads can transfer at once without contending for one
+    channel. Workers are handed out with lease().
+
+    Attributes:
+        transport: The transport the channels were opened on
+    """
+
+    def __init__(self, client, size: int):
+        """
+        Open the channels.
+
+        Args:
+            client: A connected SlateSFTP instance
+            size: Number of channels to open
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.transport = client.transport
+        self._workers = []
+        self._idle = queue.Queue()
+        try:
+            for _ in range(size):
+                worker = client._open_worker()
+                self._workers.append(worker)
+                self._idle.put(worker)
+        except Exception:
+            self.close()
+            raise
+
+    @contextmanager
+    def lease(self):
+        """Borrow a worker for the duration of a with block."""
+        worker = self._idle.get()
+        try:
+            yield worker
+        finally:
+            self._idle.put(worker)
+
+    def run(self, method: str, *args, **kwargs):
+        """Call a SlateSFTP method on the next free worker and return its result."""
+        with self.lease() as worker:
+            return getattr(worker, method)(*args, **kwargs)
+
+    def close(self):
+        """Close every channel in the pool."""
+        for worker in self._workers:
+            worker.close()
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SlateSFTPPool:
+    """
+    A thread-safe pool of authenticated connections and their SFTP channels.
+
+    Up to max_connections transports are opened on demand, each carrying up
+    to channels_per_connection SFTP channels. lease() hands out a channel
+    as a SlateSFTP that supports every client method; returning it keeps
+    the channel open for the next lease, so callers skip the TCP connect,
+    key exchange and authentication. Channels are checked before they are
+    handed out, and channels idle longer than idle_timeout are closed,
+    along with connections left without channels.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int = 22,
+        username: str = None,
+        private_key_path: str = None,
+        max_connections: int = 2,
+        channels_per_connection: int = 4,
+        idle_timeout: float = 300.0,
+        ping_after: float = 30.0,
+        **client_options
+    ):
+        """
+        Initialize the pool. No connection is made until the first lease.
+
+        Args:
+            hostname: The SFTP server hostname
+            port: The SFTP server port (default: 22)
+            username: Your SFTP username
+            private_key_path: Path to your private key file
+            max_connections: Maximum authenticated transports (default: 2)
+            channels_per_connection: Maximum SFTP channels per transport (default: 4)
+            idle_timeout: Seconds an unused channel is kept open (default: 300)
+            ping_after: Channels idle longer than this many seconds are
+                checked with a round trip before being leased (default: 30)
+            **client_options: Passed to each SlateSFTP, e.g. tuning or cache_ttl
+        """
+        if max_connections < 1 or channels_per_connection < 1:
+            raise ValueError("max_connections and channels_per_connection must be at least 1")
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.private_key_path = private_key_path
+        self.max_connections = max_connections
+        self.channels_per_connection = channels_per_connection
+        self.idle_timeout = idle_timeout
+        self.ping_after = ping_after
+        self.client_options = client_options
+        # transport -> the SlateSFTP that owns it
+        self._connections = {}
+        # transport -> channels open on it, leased or idle
+        self._channels = {}
+        # (worker, time returned), most recently returned last
+        self._idle = []
+        # id(worker) -> transport, for channels currently leased
+        self._leased = {}
+        self._connecting = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """
+        Borrow a channel for the duration of a with block.
+
+        Args:
+            timeout: Seconds to wait for a free channel (default: None, wait forever)
+
+        Yields:
+            SlateSFTP: a connected client using the leased channel
+        """
+        worker = self.acquire(timeout)
+        try:
+            yield worker
+        finally:
+            self.release(worker)
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Take a channel out of the pool; give it back with release().
+
+        Reuses the most recently returned healthy channel, else opens a
+        channel on a connection with room, else opens a new connection,
+        else waits for a channel to be returned.
+
+        Args:
+            timeout: Seconds to wait for a free channel (default: None, wait forever)
+
+        Returns:
+            SlateSFTP: a connected client using the leased channel
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise ConnectionError("The connection pool is closed.")
+                self._evict_idle_locked()
+                if self._idle:
+                    worker, returned = self._idle.pop()
+                    action = "check"
+                else:
+                    owner = self._connection_with_room_locked()
+                    if owner is not None:
+                        self._channels[owner.transport] += 1
+                        action = "open_channel"
+                    elif len(self._connections) + self._connecting < self.max_connections:
+                        self._connecting += 1
+                        action = "connect"
+                    else:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            raise TimeoutError(f"No SFTP channel became free within {timeout} seconds")
+                        self._condition.wait(remaining)
+                        continue
+
+            # Network round trips happen outside the lock
+            if action == "check":
+                if self._healthy(worker, time.monotonic() - returned):
+                    return self._track(worker)
+                self._discard(worker, worker.transport)
+            elif action == "open_channel":
+                try:
+                    return self._track(owner._open_worker())
+                except Exception:
+                    self._discard_slot(owner.transport)
+                    raise
+            else:
+                return self._track(self._connect())
+
+    def release(self, worker):
+        """
+        Return a channel taken with acquire().
+
+        Args:
+            worker: The SlateSFTP returned by acquire()
+        """
+        with self._condition:
+            transport = self._leased.pop(id(worker), None)
+        if not self._healthy(worker):
+            self._discard(worker, transport)
+            return
+        with self._condition:
+            if self._closed:
+                # close() left this channel's connection open until now
+                worker.close()
+                self._free_slot_locked(transport)
+                return
+            self._idle.append((worker, time.monotonic()))
+            self._condition.notify()
+
+    def run(self, method: str, *args, **kwargs):
+        """Call a SlateSFTP method on a leased channel and return its result."""
+        with self.lease() as worker:
+            return getattr(worker, method)(*args, **kwargs)
+
+    def evict_idle(self):
+        """Close channels idle longer than idle_timeout, and connections left without channels."""
+        with self._condition:
+            self._evict_idle_locked()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report the pool's current size.
+
+        Returns:
+            Dict with the number of connections, open channels, idle channels and leased channels
+        """
+        with self._condition:
+            channels = sum(self._channels.values())
+            return {
+                "connections": len(self._connections),
+                "channels": channels,
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+            }
+
+    def close(self):
+        """
+        Close every idle channel and every connection without leased channels.
+
+        A connection with channels still leased stays open until the last
+        of them is returned, so operations in progress can finish.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for worker, _ in idle:
+                transport = worker.transport
+                worker.close()
+                self._channels[transport] -= 1
+            for transport, channels in list(self._channels.items()):
+                if not channels:
+                    self._close_connection_locked(transport)
+            self._condition.notify_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _connect(self):
+        """Open a new connection and lease its first channel."""
+        from .client import SlateSFTP
+
+        owner = SlateSFTP(
+            self.hostname, self.port, self.username, self.private_key_path, **self.client_options
+        )
+        try:
+            connected = owner.connect()
+            worker = owner._open_worker() if connected else None
+            if connected:
+                # Only leased and idle channels count towards the server's
+                # session limit; the owner keeps just the transport
+                owner.sftp.close()
+                owner.sftp = None
+        except Exception:
+            owner.close()
+            connected = False
+        with self._condition:
+            self._connecting -= 1
+            if not connected:
+                self._condition.notify()
+                raise ConnectionError(f"Could not connect to {self.hostname}:{self.port}")
+            self._connections[owner.transport] = owner
+            self._channels[owner.transport] = 1
+            # Waiting callers can now open channels on this connection
+            self._condition.notify_all()
+        return worker
+
+    def _connection_with_room_locked(self):
+        """Return a live connection with room for another channel, or None."""
+        for transport, owner in list(self._connections.items()):
+            if not transport.is_active():
+                self._close_connection_locked(transport)
+            elif self._channels[transport] < self.channels_per_connection:
+                return owner
+        return None
+
+    def _healthy(self, worker, idle_for: float = 0.0) -> bool:
+        """Check a channel's transport and channel, with a round trip if it sat idle long enough."""
+        if not worker.sftp or not worker.transport or not worker.transport.is_active():
+            return False
+        if worker.sftp.get_channel().closed:
+            return False
+        if idle_for > self.ping_after:
+            try:
+                worker.sftp.normalize(".")
+            except Exception:
+                return False
+        return True
+
+    def _track(self, worker):
+        """Record a channel as leased and return it."""
+        with self._condition:
+            self._leased[id(worker)] = worker.transport
+        return worker
+
+    def _discard(self, worker, transport):
+        """Close a channel and free its slot on transport."""
+        worker.close()
+        self._discard_slot(transport)
+
+    def _discard_slot(self, transport):
+        """Free a channel slot, closing the connection if its transport died."""
+        with self._condition:
+            self._free_slot_locked(transport)
+            self._condition.notify()
+
+    def _free_slot_locked(self, transport):
+        """
+        Free a channel slot; the caller holds the lock.
+
+        The connection is closed if its transport died, or if the pool is
+        closed and this was its last channel.
+        """
+        if transport in self._channels:
+            self._channels[transport] -= 1
+            if not transport.is_active() or (self._closed and not self._channels[transport]):
+                self._close_connection_locked(transport)
+
+    def _evict_idle_locked(self):
+        """Close idle channels past idle_timeout; the caller holds the lock."""
+        now = time.monotonic()
+        keep = []
+        for worker, returned in self._idle:
+            if now - returned > self.idle_timeout:
+                transport = worker.transport
+                worker.close()
+                self._channels[transport] -= 1
+                if not self._channels[transport]:
+                    self._close_connection_locked(transport)
+            else:
+                keep.append((worker, returned))
+        self._idle = keep
+
+    def _close_connection_locked(self, transport):
+        """Close a connection and forget its idle channels."""
+        owner = self._connections.pop(transport, None)
+        self._channels.pop(transport, None)
+        self._idle = [(worker, returned) for worker, returned in self._idle if worker.transport is not transport]
+        if owner is not None:
+            owner.close()
+        self._condition.notify_all()
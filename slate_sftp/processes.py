@@ -0,0 +1,139 @@
+"""
+Run file transfers in worker processes, each with its own connection.
+
+paramiko encrypts and packetizes in Python, so one process saturates a
+core well before a fast link. Spreading transfers over processes lets the
+encryption run on several cores at once.
+"""
+
+import multiprocessing
+import os
+import queue
+from functools import partial
+from typing import Callable, Iterable, Optional, Tuple
+
+from .transfer import TransferReport, TransferResult, notify_progress, timed_transfer
+
+
+def run_in_processes(
+    settings: dict,
+    method: str,
+    jobs: Iterable[Tuple[str, str]],
+    processes: int,
+    local_side: int,
+    progress: Optional[Callable[[TransferResult], None]] = None,
+    **options
+) -> TransferReport:
+    """
+    Run single-file transfers spread over worker processes.
+
+    Each process opens its own SlateSFTP connection from settings and keeps
+    taking jobs from a bounded queue, so a generator of jobs is consumed no
+    faster than the processes can transfer. Results are sent back to this
+    process as each file finishes.
+
+    Processes are started with the 'spawn' method, so scripts that call
+    this must guard their entry point with if __name__ == '__main__'.
+
+    Args:
+        settings: Keyword arguments for SlateSFTP() in each process
+        method: Name of the single-file method, e.g. 'download_file'
+        jobs: Iterable of (source, destination) path pairs
+        processes: Number of worker processes
+        local_side: Index (0 or 1) of the local path in each job, used to measure bytes
+        progress: Called with each TransferResult as it arrives
+        **options: Extra keyword arguments passed to every call of method
+
+    Returns:
+        TransferReport with results in the same order as jobs
+    """
+    if processes < 1:
+        raise ValueError("processes must be at least 1")
+
+    # Forking would copy the parent's paramiko threads and their locks
+    context = multiprocessing.get_context("spawn")
+    pending = context.Queue(maxsize=processes * 2)
+    finished = context.Queue()
+    workers = [
+        context.Process(
+            target=_worker,
+            args=(settings, method, options, local_side, pending, finished),
+            daemon=True,
+        )
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    results = []
+    running = processes
+
+    def collect(block: bool):
+        nonlocal running
+        while running:
+            try:
+                item = finished.get(timeout=1.0) if block else finished.get_nowait()
+            except queue.Empty:
+                if not block:
+                    return
+                if not any(worker.is_alive() for worker in workers):
+                    # A worker died without reporting back
+                    return
+                continue
+            if item is None:
+                running -= 1
+                continue
+            results.append(item)
+            notify_progress(progress, item[1])
+
+    def submit(item) -> bool:
+        # Waits for room in the queue, collecting results meanwhile
+        while True:
+            try:
+                pending.put(item, timeout=1.0)
+                return True
+            except queue.Full:
+                collect(block=False)
+                if not any(worker.is_alive() for worker in workers):
+                    return False
+
+    try:
+        for item in enumerate(jobs):
+            if not submit(item):
+                raise RuntimeError("All transfer processes exited")
+            collect(block=False)
+    finally:
+        for _ in workers:
+            submit(None)
+        collect(block=True)
+        for worker in workers:
+            worker.join()
+
+    report = TransferReport()
+    for _, result in sorted(results, key=lambda item: item[0]):
+        report.add(result)
+    return report
+
+
+def _worker(settings: dict, method: str, options: dict, local_side: int, pending, finished):
+    """Connect, then transfer jobs from pending until the None sentinel arrives."""
+    from .client import SlateSFTP
+
+    client = SlateSFTP(**settings)
+    connected = client.connect()
+    try:
+        transfer = partial(getattr(client, method), **options)
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            index, job = item
+            if connected:
+                result = timed_transfer(transfer, job[0], job[1], job[local_side])
+            else:
+                # Keep taking jobs so the parent never waits on this process
+                result = TransferResult(os.path.basename(job[0]), job[0], job[1])
+            finished.put((index, result))
+    finally:
+        client.close()
+        finished.put(None)
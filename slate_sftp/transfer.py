@@ -0,0 +1,155 @@
+"""
+Per-file transfer results, aggregate throughput reporting and byte-range
+helpers for segmented transfers.
+"""
+
+import os
+import time
+from typing import Callable, List, Optional, Tuple
+
+
+class TransferResult:
+    """
+    The outcome of a single file transfer.
+
+    Attributes:
+        name: The file name
+        source: The path the file was read from
+        destination: The path the file was written to
+        success: Whether the transfer succeeded
+        bytes: Number of bytes transferred
+        seconds: Wall-clock duration of the transfer
+    """
+
+    __slots__ = ("name", "source", "destination", "success", "bytes", "seconds")
+
+    def __init__(self, name: str, source: str, destination: str,
+                 success: bool = False, bytes: int = 0, seconds: float = 0.0):
+        self.name = name
+        self.source = source
+        self.destination = destination
+        self.success = success
+        self.bytes = bytes
+        self.seconds = seconds
+
+    def __repr__(self):
+        return "TransferResult(name={!r}, success={}, bytes={}, seconds={:.3f})".format(
+            self.name, self.success, self.bytes, self.seconds
+        )
+
+
+class TransferReport(list):
+    """
+    Results of a multi-file transfer.
+
+    The report is a list of (filename, success) tuples, as returned by
+    download_files/upload_files, with the detailed per-file TransferResult
+    objects in results and aggregate numbers as properties. Files left out
+    on purpose, e.g. because a transfer manifest shows they were fetched
+    before, are listed by source path in skipped.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.results = []
+        self.skipped = []
+        self.elapsed = 0.0
+
+    def add(self, result: TransferResult):
+        """Record the result of one file."""
+        self.results.append(result)
+        self.append((result.name, result.success))
+
+    @property
+    def succeeded(self) -> int:
+        """Number of files transferred successfully."""
+        return sum(1 for result in self.results if result.success)
+
+    @property
+    def failed(self) -> int:
+        """Number of files that failed to transfer."""
+        return len(self.results) - self.succeeded
+
+    @property
+    def bytes_transferred(self) -> int:
+        """Total bytes of the successful transfers."""
+        return sum(result.bytes for result in self.results if result.success)
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate throughput in bytes per second over the whole run."""
+        return self.bytes_transferred / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """A one-line human readable summary of the run."""
+        summary = "{} of {} files, {:,.1f} KB in {:.2f}s ({:,.1f} KB/s)".format(
+            self.succeeded, len(self.results), self.bytes_transferred / 1024,
+            self.elapsed, self.throughput / 1024
+        )
+        if self.skipped:
+            summary += ", {} skipped".format(len(self.skipped))
+        return summary
+
+
+def notify_progress(progress: Optional[Callable[[TransferResult], None]], result: TransferResult):
+    """
+    Pass a finished transfer to a progress callback, if there is one.
+
+    An error raised by the callback is printed rather than propagated, so a
+    faulty callback cannot stop the transfer loop that called it.
+
+    Args:
+        progress: The callback, or None
+        result: The TransferResult to pass to it
+    """
+    if progress is None:
+        return
+    try:
+        progress(result)
+    except Exception as e:
+        print(f"Progress callback failed for {result.source}: {str(e)}")
+
+
+def timed_transfer(transfer, source: str, destination: str, size_path: Optional[str] = None) -> TransferResult:
+    """
+    Run a single-file transfer function and time it.
+
+    Args:
+        transfer: Callable taking (source, destination) and returning a bool
+        source: The path to read from
+        destination: The path to write to
+        size_path: Local path whose size is the number of bytes moved
+
+    Returns:
+        TransferResult
+    """
+    start = time.monotonic()
+    try:
+        success = transfer(source, destination)
+    except Exception as e:
+        print(f"Failed to transfer {source} to {destination}: {str(e)}")
+        success = False
+    seconds = time.monotonic() - start
+    size = 0
+    if success and size_path:
+        try:
+            size = os.path.getsize(size_path)
+        except OSError:
+            pass
+    return TransferResult(os.path.basename(source), source, destination, success, size, seconds)
+
+
+def split_ranges(size: int, range_size: int) -> List[Tuple[int, int]]:
+    """
+    Split a file of the given size into consecutive byte ranges.
+
+    Args:
+        size: Total number of bytes
+        range_size: Maximum length of each range
+
+    Returns:
+        List of (offset, length) tuples covering the whole file
+    """
+    if range_size < 1:
+        raise ValueError("range_size must be at least 1")
+    return [(offset, min(range_size, size - offset)) for offset in range(0, size, range_size)]
@@ -0,0 +1,156 @@
+"""
+Helpers for planning operations over whole directory trees.
+"""
+
+import os
+from typing import Iterable, Iterator, List, Tuple
+
+
+def plan_mkdirs(remote_dirs: Iterable[str], known_dirs: Iterable[str] = ()) -> List[str]:
+    """
+    Compute the directories that may need creating for a set of remote directories.
+
+    Every requested directory and its ancestors are included once, minus any
+    directory already known to exist (an ancestor of a known directory is
+    known too). The result is ordered parents-first, so creating the
+    directories in order never needs a parent that is not there yet.
+
+    Args:
+        remote_dirs: Remote directories that must exist
+        known_dirs: Remote directories already known to exist
+
+    Returns:
+        List of normalized directory paths in dependency order
+    """
+    known = set()
+    for directory in known_dirs:
+        known.update(_with_ancestors(directory))
+
+    needed = set()
+    for directory in remote_dirs:
+        for path in _with_ancestors(directory):
+            if path in known or path in needed:
+                # Its ancestors have already been considered
+                break
+            needed.add(path)
+
+    return sorted(needed, key=lambda path: (path.count("/"), path))
+
+
+def paths_under(paths: Iterable[str], roots: Iterable[str]) -> List[str]:
+    """
+    Select the paths that are one of roots or lie somewhere below one.
+
+    Each path's ancestors are looked up in a set of the roots, so the cost
+    grows with the number of paths and their depth, not with paths times
+    roots.
+
+    Args:
+        paths: Remote paths to check, e.g. the directories known to exist
+        roots: Remote paths whose subtrees are wanted, e.g. renamed directories
+
+    Returns:
+        List of the paths inside one of the roots, in their original order
+    """
+    roots = {normalize_remote_dir(root) for root in roots}
+    return [path for path in paths if any(ancestor in roots for ancestor in _with_ancestors(path))]
+
+
+def normalize_remote_dir(remote_dir: str) -> str:
+    """Normalize a remote directory path, e.g. '/incoming/' -> '/incoming'."""
+    return os.path.normpath(remote_dir) if remote_dir else ""
+
+
+def _with_ancestors(remote_dir: str) -> List[str]:
+    """Return a directory followed by each of its ancestors, nearest first."""
+    paths = []
+    path = normalize_remote_dir(remote_dir)
+    while path and path not in ("/", "."):
+        paths.append(path)
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return paths
+
+
+def scan_local_tree(local_dir: str, recursive: bool = True) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """
+    Walk a local directory tree top-down using os.scandir.
+
+    The entry type comes from the directory entry itself (d_type on POSIX,
+    the find data on Windows), so no extra stat is made per file.
+
+    Args:
+        local_dir: The local directory to scan
+        recursive: Whether to descend into subdirectories (default: True)
+
+    Yields:
+        Tuples of (relative_dir, directory_names, file_names), where
+        relative_dir is '' for local_dir itself
+    """
+    stack = [""]
+    while stack:
+        relative_dir = stack.pop()
+        directories = []
+        files = []
+        with os.scandir(os.path.join(local_dir, relative_dir)) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    directories.append(entry.name)
+                else:
+                    files.append(entry.name)
+        yield relative_dir, directories, files
+        if recursive:
+            stack.extend(os.path.join(relative_dir, name) for name in reversed(directories))
+
+
+def same_size_and_mtime(local_stat: os.stat_result, size: int, mtime: float) -> bool:
+    """
+    Check whether a local file matches remote attributes by size and mtime.
+
+    SFTP reports whole-second modification times, so the local mtime is
+    compared at one-second resolution.
+
+    Args:
+        local_stat: os.stat() result of the local file
+        size: Size of the remote file in bytes
+        mtime: Modification time of the remote file as a Unix timestamp
+
+    Returns:
+        bool: True if both the size and the mtime match
+    """
+    return local_stat.st_size == size and int(local_stat.st_mtime) == int(mtime)
+
+
+def split_changed(
+    local_files: Iterable[Tuple[str, int, float]], remote_files: Iterable[Tuple[str, int, float]]
+) -> Tuple[List[str], List[Tuple[str, int]]]:
+    """
+    Compare a local and a remote listing in one sorted merge.
+
+    Both listings hold (relative_path, size, mtime) tuples and must be
+    sorted by relative_path. A local file counts as unchanged when the
+    remote file at the same path has the same size and the same mtime at
+    one-second resolution, as in same_size_and_mtime.
+
+    Args:
+        local_files: The local files, sorted by relative path
+        remote_files: The remote files, sorted by relative path
+
+    Returns:
+        Tuple of (changed, unchanged): the relative paths of local files
+        that are new or differ, and (relative_path, size) for the rest
+    """
+    changed = []
+    unchanged = []
+    remote = iter(remote_files)
+    current = next(remote, None)
+    for path, size, mtime in local_files:
+        while current is not None and current[0] < path:
+            current = next(remote, None)
+        if current is not None and current[0] == path and current[1] == size and int(current[2]) == int(mtime):
+            unchanged.append((path, size))
+        else:
+            changed.append(path)
+    return changed, unchanged
@@ -0,0 +1,120 @@
+"""
+Transport and transfer tuning knobs for SlateSFTP.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+# Ciphers that are fast in software on most hosts, for TransferTuning(ciphers=...).
+# Names the installed paramiko does not support are skipped.
+FAST_CIPHERS = (
+    "aes128-gcm@openssh.com",
+    "aes256-gcm@openssh.com",
+    "chacha20-poly1305@openssh.com",
+    "aes128-ctr",
+)
+# Key exchanges with cheap elliptic-curve math, for TransferTuning(kex=...)
+FAST_KEX = (
+    "curve25519-sha256@libssh.org",
+    "ecdh-sha2-nistp256",
+)
+
+
+class TransferTuning:
+    """
+    A tuning profile for SSH channels and SFTP file transfers.
+
+    The channel defaults match paramiko's own, and request sizes follow the
+    server's advertised limits where it reports them. On high-latency links, a larger window and more
+    concurrent prefetch requests keep more data in flight; larger chunk
+    sizes cut the number of requests, up to what the server accepts.
+
+    Attributes:
+        window_size: SSH channel window size in bytes (None: paramiko default, 2 MiB)
+        max_packet_size: SSH channel max packet size in bytes (None: paramiko default, 32 KiB)
+        prefetch: Whether downloads prefetch the whole file with pipelined reads
+        max_concurrent_prefetch_requests: Cap on read requests in flight while
+            prefetching (None: no cap). paramiko polls every few milliseconds
+            while the cap is reached, so a small cap slows fast links down
+        read_chunk_size: Bytes per SFTP read request (None: sized from the
+            server's advertised limits, else 32 KiB)
+        write_chunk_size: Bytes per SFTP write request (None: as read_chunk_size,
+            from the server's max write length)
+        ciphers: Ciphers to offer first, in order of preference (None: paramiko's order)
+        kex: Key exchange algorithms to offer first (None: paramiko's order)
+
+    Explicit chunk sizes are still capped at the server's advertised limits.
+    Preferred ciphers and key exchanges are moved to the front of paramiko's
+    own lists; names paramiko does not support are skipped, and the server
+    still has to support the one that is chosen.
+    """
+
+    __slots__ = (
+        "window_size",
+        "max_packet_size",
+        "prefetch",
+        "max_concurrent_prefetch_requests",
+        "read_chunk_size",
+        "write_chunk_size",
+        "ciphers",
+        "kex",
+    )
+
+    def __init__(
+        self,
+        window_size: Optional[int] = None,
+        max_packet_size: Optional[int] = None,
+        prefetch: bool = True,
+        max_concurrent_prefetch_requests: Optional[int] = None,
+        read_chunk_size: Optional[int] = None,
+        write_chunk_size: Optional[int] = None,
+        ciphers: Optional[Sequence[str]] = None,
+        kex: Optional[Sequence[str]] = None,
+    ):
+        for chunk_size in (read_chunk_size, write_chunk_size):
+            if chunk_size is not None and chunk_size < 1:
+                raise ValueError("Chunk sizes must be at least 1 byte")
+        self.window_size = window_size
+        self.max_packet_size = max_packet_size
+        self.prefetch = prefetch
+        self.max_concurrent_prefetch_requests = max_concurrent_prefetch_requests
+        self.read_chunk_size = read_chunk_size
+        self.write_chunk_size = write_chunk_size
+        self.ciphers = tuple(ciphers) if ciphers else None
+        self.kex = tuple(kex) if kex else None
+
+    def transport_options(self) -> dict:
+        """Keyword arguments for paramiko.Transport()."""
+        options = {}
+        if self.window_size is not None:
+            options["default_window_size"] = self.window_size
+        if self.max_packet_size is not None:
+            options["default_max_packet_size"] = self.max_packet_size
+        return options
+
+    def channel_options(self) -> dict:
+        """Keyword arguments for paramiko.SFTPClient.from_transport()."""
+        return {"window_size": self.window_size, "max_packet_size": self.max_packet_size}
+
+    def apply_security_options(self, transport):
+        """
+        Reorder a transport's ciphers and key exchanges by this profile's preferences.
+
+        Args:
+            transport: A paramiko.Transport that has not started negotiating yet
+        """
+        options = transport.get_security_options()
+        if self.ciphers:
+            options.ciphers = _prefer(self.ciphers, options.ciphers)
+        if self.kex:
+            options.kex = _prefer(self.kex, options.kex)
+
+    def __repr__(self):
+        return "TransferTuning({})".format(
+            ", ".join("{}={!r}".format(name, getattr(self, name)) for name in self.__slots__)
+        )
+
+
+def _prefer(preferred: Sequence[str], available: Sequence[str]) -> Tuple[str, ...]:
+    """Move the supported names of preferred to the front of available, keeping the rest."""
+    first = [name for name in preferred if name in available]
+    return tuple(first + [name for name in available if name not in first])
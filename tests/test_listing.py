@@ -0,0 +1,65 @@
+"""
+Listing tests against a local SFTP server.
+
+Like the CLI, importing slate_sftp needs config.py to be importable, so put
+the directory that holds it on PYTHONPATH; the tests are skipped otherwise.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+import pytest
+
+pytest.importorskip("config")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from _local_server import LocalSFTPServer  # noqa: E402
+from slate_sftp import SlateSFTP  # noqa: E402
+
+FILE_COUNT = 200
+
+
+@pytest.fixture
+def remote_root():
+    with tempfile.TemporaryDirectory() as root:
+        listed = os.path.join(root, "listed")
+        os.makedirs(os.path.join(listed, "subdir"))
+        for i in range(FILE_COUNT):
+            with open(os.path.join(listed, f"file_{i:04d}.csv"), "w") as f:
+                f.write("x" * i)
+        os.symlink(os.path.join(listed, "file_0010.csv"), os.path.join(listed, "valid_link"))
+        os.symlink(os.path.join(listed, "missing.csv"), os.path.join(listed, "dangling_link"))
+        yield root
+
+
+def list_with_timeout(sftp, remote_path, timeout=30):
+    """List a directory in a thread so a hung listing fails instead of blocking the run."""
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(entries=list(sftp.iter_entries(remote_path))), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive(), f"listing {remote_path} did not finish"
+    return result["entries"]
+
+
+@pytest.mark.parametrize("cache_ttl", [0, 60])
+def test_iter_entries_resolves_symlinks(remote_root, cache_ttl):
+    with LocalSFTPServer(remote_root) as server:
+        with SlateSFTP(
+            hostname="127.0.0.1",
+            port=server.port,
+            username="test",
+            private_key_path=server.client_key_path,
+            cache_ttl=cache_ttl,
+        ) as sftp:
+            entries = {entry.name: entry for entry in list_with_timeout(sftp, "/listed")}
+
+    assert len(entries) == FILE_COUNT + 2
+    assert "dangling_link" not in entries
+    assert entries["valid_link"].is_file
+    assert entries["valid_link"].size == 10
+    assert entries["subdir"].is_dir
+    assert entries["file_0199.csv"].size == 199